@@ -3,9 +3,12 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import datetime as dt
+import logging
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
+import aiohttp
 import discord
 from redbot.core import Config, checks, commands
 
@@ -13,6 +16,8 @@ __red_end_user_data_statement__ = (
     "This cog stores moderation case metadata and minimal log context (IDs and excerpts) per guild."
 )
 
+log = logging.getLogger("red.cogs.modlogx")
+
 # ------------------ Visuals ------------------
 EVENT_ICONS = {
     # messages
@@ -84,6 +89,31 @@ DEFAULTS_GUILD = {
     "prune_count": 0,
 }
 
+# Seconds a guild's settings stay cached in memory before re-reading Config.
+CONFIG_CACHE_TTL = 60.0
+# Embeds queued within this window are coalesced into one webhook message.
+EMBED_BATCH_WINDOW = 1.0
+# Discord caps a single message at 10 embeds / 6000 embed characters.
+EMBED_BATCH_MAX = 10
+EMBED_BATCH_CHARS = 6000
+# How long a listener waits for the matching audit entry from the gateway,
+# and how long an unclaimed entry is kept for a listener that runs late.
+AUDIT_WAIT = 3.0
+AUDIT_KEEP = 10.0
+# Message deletes wait less: repeat deletes are merged into an existing entry (no gateway event),
+# and self-deletes get no entry at all, so after this the audit log is read over REST instead.
+AUDIT_DELETE_WAIT = 1.0
+# A brand-new entry only seen over REST is trusted if it is at most this old...
+AUDIT_DELETE_FRESH = 20.0
+# ...and merged-delete counts are remembered this long per entry.
+AUDIT_COUNT_KEEP = 600.0
+# Audit actions logged under the AutoMod "rules" category.
+AUTOMOD_RULE_ACTIONS = frozenset({
+    discord.AuditLogAction.automod_rule_create,
+    discord.AuditLogAction.automod_rule_update,
+    discord.AuditLogAction.automod_rule_delete,
+})
+
 # ------------------ Small helpers ------------------
 def now_utc() -> dt.datetime:
     return dt.datetime.now(tz=dt.timezone.utc)
@@ -118,6 +148,40 @@ def _role_diff(before_roles: List[discord.Role], after_roles: List[discord.Role]
     removed.sort(key=lambda r: (-r.position, r.name.lower()))
     return added, removed
 
+# Permission bit -> flag name (first name wins, so aliases don't shadow the canonical flag).
+PERM_BIT_NAME: Dict[int, str] = {}
+for _name, _bit in discord.Permissions.VALID_FLAGS.items():
+    PERM_BIT_NAME.setdefault(_bit, _name)
+
+def _perm_names(mask: int) -> List[str]:
+    """Names of the permission bits set in mask, lowest bit first."""
+    names = []
+    while mask:
+        bit = mask & -mask
+        names.append(PERM_BIT_NAME.get(bit, f"bit_{bit.bit_length() - 1}"))
+        mask ^= bit
+    return names
+
+def _embed_batches(embeds: List[discord.Embed]) -> Iterable[List[discord.Embed]]:
+    """Split embeds into runs that fit in one webhook message, keeping order."""
+    batch: List[discord.Embed] = []
+    size = 0
+    for e in embeds:
+        n = len(e)
+        if batch and (len(batch) >= EMBED_BATCH_MAX or size + n > EMBED_BATCH_CHARS):
+            yield batch
+            batch, size = [], 0
+        batch.append(e)
+        size += n
+    if batch:
+        yield batch
+
+# Channel attributes on_guild_channel_update reports; anything else (position, overwrites, ...) is ignored.
+CHANNEL_TRACKED_ATTRS = ("name", "slowmode_delay", "nsfw", "topic", "bitrate", "user_limit")
+
+def _channel_signature(c: discord.abc.GuildChannel) -> Tuple[Any, ...]:
+    return tuple(getattr(c, a, None) for a in CHANNEL_TRACKED_ATTRS)
+
 def _role_mentions(roles: List[discord.Role]) -> str:
     return ", ".join(r.mention for r in roles) if roles else "*none*"
 
@@ -127,6 +191,34 @@ def _bool_emoji(v: bool) -> str:
 def _identity_label(mode: str) -> str:
     return "Bot identity" if mode == "bot" else "Per-event identity"
 
+Describe = Callable[..., Tuple[str, Iterable[Tuple[str, str, bool]]]]
+
+def _simple_listener(
+    event: str,
+    category: str,
+    event_key: str,
+    title: str,
+    guild_of: Callable[..., Optional[discord.Guild]],
+    describe: Describe,
+):
+    """Build a listener that logs one embed when `category` is enabled for the event's guild.
+
+    Listeners that only check the category and send a fixed-title embed share this
+    body; `describe` receives the event args and returns (description, fields).
+    """
+    async def listener(self: "ModLogX", *args) -> None:
+        g = guild_of(*args)
+        if not self._active(g):
+            return
+        ok, cat = await self._event_ctx(g, category)
+        if not (ok and cat):
+            return
+        description, fields = describe(*args)
+        await self._send_embed(g, event_key=event_key, title=title, description=description, fields=fields)
+
+    listener.__name__ = listener.__qualname__ = event
+    return commands.Cog.listener(event)(listener)
+
 # ------------------ Setup View (UI) ------------------
 class SetupView(discord.ui.View):
     def __init__(self, cog: "ModLogX", guild: discord.Guild, *, timeout: int = 300):
@@ -262,6 +354,7 @@ class _Save(discord.ui.Button):
         await self._view.cog.config.guild(self._view.guild).use_embeds.set(bool(self._view.state["use_embeds"]))
         await self._view.cog.config.guild(self._view.guild).webhook_identity.set(self._view.state.get("webhook_identity", "bot"))
         await self._view.cog.config.guild(self._view.guild).webhook_url.set(self._view.state.get("webhook_url"))
+        await self._view.cog._reload(self._view.guild)
         await interaction.response.send_message("Saved.", ephemeral=True)
         await self._view.refresh()
 
@@ -286,11 +379,51 @@ class ModLogX(commands.Cog):
         self.bot = bot
         self.config = Config.get_conf(self, identifier=0xA51D0ECAFE2025, force_registration=True)
         self.config.register_guild(**DEFAULTS_GUILD)
-        self._audit_fetch_lock: Dict[int, asyncio.Lock] = {}
+        # (guild_id, action, target_id) -> one future per waiting event, oldest first; resolved by on_audit_log_entry_create
+        self._pending_actions: Dict[Tuple[int, discord.AuditLogAction, int], List[asyncio.Future]] = {}
+        # message_delete audit entry id -> (deletions already attributed from its count, when last seen)
+        self._delete_counts: Dict[int, Tuple[int, float]] = {}
+        # entries that arrived before any listener asked for them
+        self._recent_audit: Dict[Tuple[int, discord.AuditLogAction, int], Tuple[float, discord.AuditLogEntry]] = {}
+        self._footer_text: Dict[int, str] = {}
+        self._cfg_cache: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+        self._enabled_guilds: Set[int] = set()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._webhooks: Dict[str, discord.Webhook] = {}
+        # (guild_id, webhook_url, username, avatar_url) -> embeds waiting to be flushed, in order
+        self._embed_queue: Dict[Tuple[int, str, str, str], List[discord.Embed]] = {}
+        self._queue_event = asyncio.Event()
+        self._flusher_task: Optional[asyncio.Task] = None
 
     # ---------- Config util ----------
+    def _cached(self, guild: discord.Guild) -> Optional[Dict[str, Any]]:
+        hit = self._cfg_cache.get(guild.id)
+        if hit is not None and time.monotonic() - hit[0] < CONFIG_CACHE_TTL:
+            return hit[1]
+        return None
+
+    def _invalidate(self, guild: discord.Guild) -> None:
+        self._cfg_cache.pop(guild.id, None)
+
+    async def _reload(self, guild: discord.Guild) -> None:
+        """Drop the cached settings and re-read them, refreshing the enabled-guild set."""
+        self._invalidate(guild)
+        await self._gdata(guild)
+
+    def _active(self, guild: Optional[discord.Guild]) -> bool:
+        """Cheap pre-check: is logging enabled with a webhook for this guild?"""
+        return guild is not None and guild.id in self._enabled_guilds
+
     async def _gdata(self, guild: discord.Guild) -> Dict[str, Any]:
-        return await self.config.guild(guild).all()
+        d = self._cached(guild)
+        if d is None:
+            d = await self.config.guild(guild).all()
+            self._cfg_cache[guild.id] = (time.monotonic(), d)
+            if d["enabled"] and d["webhook_url"]:
+                self._enabled_guilds.add(guild.id)
+            else:
+                self._enabled_guilds.discard(guild.id)
+        return d
 
     async def _enabled(self, guild: discord.Guild) -> bool:
         d = await self._gdata(guild)
@@ -299,6 +432,16 @@ class ModLogX(commands.Cog):
     async def _cat(self, guild: discord.Guild, name: str) -> Any:
         return (await self._gdata(guild))["categories"].get(name)
 
+    async def _event_ctx(self, guild: discord.Guild, name: str) -> Tuple[bool, Any]:
+        """Return (enabled_and_webhook_set, category_value) from a single config read.
+
+        Listeners gate on `_active` before calling this.
+        """
+        d = await self._gdata(guild)
+        if not (d["enabled"] and d["webhook_url"]):
+            return False, None
+        return True, d["categories"].get(name)
+
     # ---------- Setup UI embed ----------
     def _build_setup_embed(self, guild: discord.Guild, state: Dict[str, Any]) -> discord.Embed:
         ch_mention = f"<#{state.get('channel_id')}>" if state.get("channel_id") else "*not set*"
@@ -313,9 +456,15 @@ class ModLogX(commands.Cog):
         e.add_field(name="Identity", value=f"`{state['webhook_identity']}`", inline=True)
         e.add_field(name="Log channel", value=ch_mention, inline=True)
         e.add_field(name="Webhook", value=wh_state, inline=True)
-        e.set_footer(text=f"{guild.name} • v{self.__version__}")
+        e.set_footer(text=self._footer_for(guild))
         return e
 
+    def _footer_for(self, guild: discord.Guild) -> str:
+        text = self._footer_text.get(guild.id)
+        if text is None:
+            text = self._footer_text[guild.id] = f"{guild.name} • v{self.__version__}"
+        return text
+
     # ---------- Webhook send ----------
     async def _send_embed(
         self,
@@ -334,14 +483,10 @@ class ModLogX(commands.Cog):
         data = await self._gdata(guild)
         if not (data["enabled"] and data["webhook_url"]):
             return
-
-        embed = discord.Embed(title=title, description=limit(description, 4000), color=color, url=url)
-        embed.timestamp = now_utc()
-        for name, value, inline in fields:
-            embed.add_field(name=name, value=limit(value, 1024), inline=inline)
-        if thumbnail_url:
-            embed.set_thumbnail(url=thumbnail_url)
-        embed.set_footer(text=footer or f"{guild.name} • v{self.__version__}")
+        # Resolve the destination before building anything to send to it.
+        wh = self._webhook_for(data["webhook_url"])
+        if wh is None:
+            return
 
         identity_mode = data.get("webhook_identity", "bot")
         if identity_mode == "bot" and self.bot.user:
@@ -351,13 +496,30 @@ class ModLogX(commands.Cog):
             username = f"ModLog • {title}"
             avatar_url = EVENT_ICONS.get(event_key, EVENT_ICONS["default"])
 
-        try:
-            wh = discord.Webhook.from_url(data["webhook_url"], client=self.bot)
-        except Exception:
-            return
+        as_embed = data["use_embeds"] and not force_plain
+        if as_embed:
+            payload: Dict[str, Any] = {
+                "title": title,
+                "description": limit(description, 4000),
+                "color": int(color),
+                "timestamp": now_utc().isoformat(),
+                "fields": [{"name": n, "value": limit(v, 1024), "inline": i} for n, v, i in fields],
+                "footer": {"text": footer or self._footer_for(guild)},
+            }
+            if url:
+                payload["url"] = url
+            if thumbnail_url:
+                payload["thumbnail"] = {"url": thumbnail_url}
+            embed = discord.Embed.from_dict(payload)
+
+            if self._flusher_task is not None:
+                key = (guild.id, data["webhook_url"], username, avatar_url)
+                self._embed_queue.setdefault(key, []).append(embed)
+                self._queue_event.set()
+                return
 
         try:
-            if data["use_embeds"] and not force_plain:
+            if as_embed:
                 await wh.send(embed=embed, username=username, avatar_url=avatar_url)
             else:
                 content = f"**{title}**\n\n{limit(description, 1800)}"
@@ -365,10 +527,69 @@ class ModLogX(commands.Cog):
                     content += f"\n\n**{n}**\n{limit(v, 1000)}"
                 await wh.send(content=content, username=username, avatar_url=avatar_url)
         except discord.NotFound:
-            await self.config.guild(guild).webhook_url.set(None)
+            await self._drop_webhook(guild.id, data["webhook_url"])
         except Exception:
             pass
 
+    async def _drop_webhook(self, guild_id: int, url: str) -> None:
+        """Forget a webhook Discord reports as deleted."""
+        self._webhooks.pop(url, None)
+        guild = self.bot.get_guild(guild_id)
+        if guild is None:
+            return
+        await self.config.guild(guild).webhook_url.set(None)
+        await self._reload(guild)
+
+    async def _flusher(self) -> None:
+        while True:
+            await self._queue_event.wait()
+            await asyncio.sleep(EMBED_BATCH_WINDOW)
+            self._queue_event.clear()
+            # a failed flush must not end the task, or queued embeds would pile up unsent
+            try:
+                await self._flush_queue()
+            except Exception:
+                log.exception("ModLogX: flushing queued log embeds failed")
+
+    async def _flush_queue(self) -> None:
+        queue, self._embed_queue = self._embed_queue, {}
+        # each destination sends on its own, so one webhook's rate-limit wait doesn't hold up the rest;
+        # order is kept within a destination
+        keys = list(queue)
+        results = await asyncio.gather(*(self._flush_key(k, queue[k]) for k in keys), return_exceptions=True)
+        for key, result in zip(keys, results):
+            if isinstance(result, Exception):
+                log.error("ModLogX: flushing logs for guild %s failed", key[0], exc_info=result)
+
+    async def _flush_key(self, key: Tuple[int, str, str, str], embeds: List[discord.Embed]) -> None:
+        guild_id, url, username, avatar_url = key
+        wh = self._webhook_for(url)
+        if wh is None:
+            return
+        for batch in _embed_batches(embeds):
+            try:
+                await wh.send(embeds=batch, username=username, avatar_url=avatar_url)
+            except discord.NotFound:
+                await self._drop_webhook(guild_id, url)
+                break
+            except Exception:
+                pass
+
+    def _webhook_for(self, url: str) -> Optional[discord.Webhook]:
+        """Return a cached webhook bound to the shared HTTP session."""
+        wh = self._webhooks.get(url)
+        if wh is not None:
+            return wh
+        try:
+            if self._session is not None:
+                wh = discord.Webhook.from_url(url, session=self._session, bot_token=self.bot.http.token)
+            else:
+                wh = discord.Webhook.from_url(url, client=self.bot)
+        except Exception:
+            return None
+        self._webhooks[url] = wh
+        return wh
+
     # ---------- Cases ----------
     @dataclass
     class Case:
@@ -422,54 +643,106 @@ class ModLogX(commands.Cog):
         return self.Case(**case)  # type: ignore[arg-type]
 
     # ---------- Audit helpers ----------
+    def _resolve_audit(self, entry: discord.AuditLogEntry) -> None:
+        """Hand a gateway audit entry to the listener waiting for it, or park it briefly."""
+        target_id = getattr(entry.target, "id", None)
+        if target_id is None:
+            return
+        now = time.monotonic()
+        if entry.action is discord.AuditLogAction.message_delete:
+            if entry.id in self._delete_counts:
+                return  # arrived late; the REST fallback already attributed it
+            # a gateway entry is always new: it accounts for one deletion
+            self._note_delete_count(entry.id, 1, now)
+        key = (entry.guild.id, entry.action, target_id)
+        waiters = self._pending_actions.get(key)
+        while waiters:
+            fut = waiters.pop(0)
+            if not fut.done():
+                fut.set_result(entry)
+                return
+        self._recent_audit[key] = (now, entry)
+        for k in [k for k, (ts, _) in self._recent_audit.items() if now - ts > AUDIT_KEEP]:
+            del self._recent_audit[k]
+
+    async def _await_audit(
+        self, guild: discord.Guild, action: discord.AuditLogAction, target_id: int, timeout: float = AUDIT_WAIT
+    ) -> Optional[discord.AuditLogEntry]:
+        """Wait up to `timeout` seconds for the audit entry matching (action, target)."""
+        key = (guild.id, action, target_id)
+        hit = self._recent_audit.pop(key, None)
+        if hit is not None and time.monotonic() - hit[0] <= AUDIT_KEEP:
+            return hit[1]
+        fut = asyncio.get_running_loop().create_future()
+        waiters = self._pending_actions.setdefault(key, [])
+        waiters.append(fut)
+        try:
+            return await asyncio.wait_for(fut, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            with contextlib.suppress(ValueError):
+                waiters.remove(fut)
+            if not waiters and self._pending_actions.get(key) is waiters:
+                del self._pending_actions[key]
+
+    def _note_delete_count(self, entry_id: int, attributed: int, now: float) -> None:
+        self._delete_counts[entry_id] = (attributed, now)
+        for k in [k for k, (_, ts) in self._delete_counts.items() if now - ts > AUDIT_COUNT_KEEP]:
+            del self._delete_counts[k]
+
     async def _who_deleted_message(self, guild: discord.Guild, message: discord.Message) -> Optional[discord.User]:
-        lock = self._audit_fetch_lock.setdefault(guild.id, asyncio.Lock())
-        async with lock:
-            with contextlib.suppress(Exception):
-                async for entry in guild.audit_logs(limit=5, action=discord.AuditLogAction.message_delete):
-                    if getattr(entry.extra, "channel", None) and entry.extra.channel.id != message.channel.id:
-                        continue
-                    if (now_utc() - entry.created_at.replace(tzinfo=dt.timezone.utc)).total_seconds() > 20:
-                        continue
-                    return entry.user
+        entry = await self._await_audit(
+            guild, discord.AuditLogAction.message_delete, message.author.id, timeout=AUDIT_DELETE_WAIT
+        )
+        if entry is not None:
+            if getattr(entry.extra, "channel", None) and entry.extra.channel.id != message.channel.id:
+                return None
+            return entry.user
+        return await self._fetch_delete_actor(guild, message)
+
+    async def _fetch_delete_actor(self, guild: discord.Guild, message: discord.Message) -> Optional[discord.User]:
+        """REST fallback for deletes Discord merged into an existing entry (its count goes up, no new event)."""
+        with contextlib.suppress(Exception):
+            async for entry in guild.audit_logs(limit=5, action=discord.AuditLogAction.message_delete):
+                if getattr(entry.target, "id", None) != message.author.id:
+                    continue
+                channel = getattr(entry.extra, "channel", None)
+                if channel is None or channel.id != message.channel.id:
+                    continue
+                now = time.monotonic()
+                count = int(getattr(entry.extra, "count", 1) or 1)
+                seen = self._delete_counts.get(entry.id)
+                if seen is None:
+                    # never seen over the gateway: only a just-created entry can be this delete
+                    age = (now_utc() - entry.created_at).total_seconds()
+                    if age > AUDIT_DELETE_FRESH:
+                        self._note_delete_count(entry.id, count, now)
+                        return None
+                    attributed = 0
+                else:
+                    attributed = seen[0]
+                if count <= attributed:
+                    return None  # nothing new on this entry: a self-delete
+                # claim one deletion, so concurrent deletes of the same author each take their own
+                self._note_delete_count(entry.id, attributed + 1, now)
+                return entry.user
         return None
 
     async def _recent_kick_for(self, guild: discord.Guild, user_id: int):
-        """Return (moderator, reason) if the user was kicked very recently; else (None, None)."""
-        try:
-            async for entry in guild.audit_logs(limit=6, action=discord.AuditLogAction.kick):
-                if not entry.target or entry.target.id != user_id:
-                    continue
-                age = (now_utc() - entry.created_at.replace(tzinfo=dt.timezone.utc)).total_seconds()
-                if age <= 30:
-                    return entry.user, entry.reason
-        except Exception:
-            pass
-        return None, None
+        """Return (moderator, reason) if the user was kicked just now; else (None, None)."""
+        entry = await self._await_audit(guild, discord.AuditLogAction.kick, user_id)
+        if entry is None:
+            return None, None
+        return entry.user, entry.reason
 
     async def _recent_timeout_for(self, guild: discord.Guild, user_id: int):
-        """Return (moderator, reason, expires_dt) for a very recent timeout change; else (None, None, None)."""
-        try:
-            async for entry in guild.audit_logs(limit=8, action=discord.AuditLogAction.member_update):
-                tgt = getattr(entry, "target", None)
-                if not tgt or tgt.id != user_id:
-                    continue
-                changes = getattr(entry, "changes", None)
-                expires = None
-                if changes:
-                    with contextlib.suppress(Exception):
-                        after = getattr(changes, "after", None) or {}
-                        expires = (
-                            after.get("communication_disabled_until")
-                            or after.get("timed_out_until")
-                            or after.get("timeout_until")
-                        )
-                age = (now_utc() - entry.created_at.replace(tzinfo=dt.timezone.utc)).total_seconds()
-                if age <= 30:
-                    return entry.user, entry.reason, expires
-        except Exception:
-            pass
-        return None, None, None
+        """Return (moderator, reason, expires_dt) for a timeout change just now; else (None, None, None)."""
+        entry = await self._await_audit(guild, discord.AuditLogAction.member_update, user_id)
+        if entry is None:
+            return None, None, None
+        expires = getattr(entry.after, "timed_out_until", None)
+        return entry.user, entry.reason, expires
 
     # ================= Commands =================
     @commands.group(name="modlogx", invoke_without_command=True)
@@ -496,11 +769,13 @@ class ModLogX(commands.Cog):
     @group.command()
     async def enable(self, ctx: commands.Context, state: Optional[bool] = None):
         await self.config.guild(ctx.guild).enabled.set(True if state is None else bool(state))
+        await self._reload(ctx.guild)
         await ctx.tick()
 
     @group.command()
     async def embeds(self, ctx: commands.Context, state: Optional[bool] = None):
         await self.config.guild(ctx.guild).use_embeds.set(True if state is None else bool(state))
+        await self._reload(ctx.guild)
         await ctx.tick()
 
     @group.command()
@@ -510,6 +785,7 @@ class ModLogX(commands.Cog):
         if mode not in {"bot", "event"}:
             return await ctx.send("Use `bot` or `event`.")
         await self.config.guild(ctx.guild).webhook_identity.set(mode)
+        await self._reload(ctx.guild)
         await ctx.tick()
 
     @group.command()
@@ -524,6 +800,7 @@ class ModLogX(commands.Cog):
         sub[event] = (not sub[event]) if state is None else bool(state)
         cats[category] = sub
         await self.config.guild(ctx.guild).categories.set(cats)
+        await self._reload(ctx.guild)
         await ctx.tick()
 
     @group.command()
@@ -557,10 +834,10 @@ class ModLogX(commands.Cog):
     # ----- Messages -----
     @commands.Cog.listener()
     async def on_message_delete(self, message: discord.Message):
-        if not (message.guild and await self._enabled(message.guild)):
+        if not self._active(message.guild):
             return
-        cats = await self._cat(message.guild, "messages")
-        if not cats or not cats.get("delete", True):
+        ok, cats = await self._event_ctx(message.guild, "messages")
+        if not ok or not cats or not cats.get("delete", True):
             return
 
         deleter = await self._who_deleted_message(message.guild, message)
@@ -611,10 +888,10 @@ class ModLogX(commands.Cog):
         if not payload.guild_id:
             return
         guild = self.bot.get_guild(payload.guild_id)
-        if not (guild and await self._enabled(guild)):
+        if not self._active(guild):
             return
-        cats = await self._cat(guild, "messages")
-        if not cats or not cats.get("delete", True):
+        ok, cats = await self._event_ctx(guild, "messages")
+        if not ok or not cats or not cats.get("delete", True):
             return
         fields = [
             ("Channel", f"<#{payload.channel_id}> • `{payload.channel_id}`", True),
@@ -635,21 +912,17 @@ class ModLogX(commands.Cog):
         if not messages:
             return
         guild = messages[0].guild
-        if not (guild and await self._enabled(guild)):
+        if not self._active(guild):
             return
-        cats = await self._cat(guild, "messages")
-        if not cats or not cats.get("purge", True):
+        ok, cats = await self._event_ctx(guild, "messages")
+        if not ok or not cats or not cats.get("purge", True):
             return
         channel = messages[0].channel
         first = min(m.created_at for m in messages)
         last = max(m.created_at for m in messages)
 
-        actor = None
-        with contextlib.suppress(Exception):
-            async for e in guild.audit_logs(limit=3, action=discord.AuditLogAction.message_bulk_delete):
-                if getattr(e.extra, "channel", None) and e.extra.channel.id == channel.id:
-                    actor = e.user
-                    break
+        entry = await self._await_audit(guild, discord.AuditLogAction.message_bulk_delete, channel.id)
+        actor = entry.user if entry else None
 
         fields = [
             ("Channel", f"{channel.mention} • `{channel.id}`", True),
@@ -675,10 +948,10 @@ class ModLogX(commands.Cog):
     @commands.Cog.listener()
     async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
         guild = self.bot.get_guild(payload.guild_id or 0)
-        if not (guild and await self._enabled(guild)):
+        if not self._active(guild):
             return
-        cats = await self._cat(guild, "messages")
-        if not cats or not cats.get("purge", True):
+        ok, cats = await self._event_ctx(guild, "messages")
+        if not ok or not cats or not cats.get("purge", True):
             return
         await self._send_embed(
             guild,
@@ -690,20 +963,23 @@ class ModLogX(commands.Cog):
 
     @commands.Cog.listener()
     async def on_message_edit(self, before: discord.Message, after: discord.Message):
-        if not (after.guild and await self._enabled(after.guild)):
-            return
         if after.author and after.author.bot:
             return
-        cats = await self._cat(after.guild, "messages")
-        if not cats or not cats.get("edit", True):
-            return
+        # Embed unfurls and pins arrive as edits with unchanged content.
         if before.content == after.content:
             return
+        if not self._active(after.guild):
+            return
+        ok, cats = await self._event_ctx(after.guild, "messages")
+        if not ok or not cats or not cats.get("edit", True):
+            return
+        # chn()/u() inlined: a guild message always has a channel and an author here.
+        ch, author = after.channel, after.author
         await self._send_embed(
             after.guild,
             event_key="message_edit",
             title="Message Edited",
-            description=f"In {chn(after.channel)} by {u(after.author)}",
+            description=f"In {ch.mention} (`{ch.id}`) by {author} (`{author.id}`)",
             fields=[
                 ("Before", limit(before.content, 1000), False),
                 ("After",  limit(after.content, 1000), False),
@@ -717,30 +993,32 @@ class ModLogX(commands.Cog):
     @commands.Cog.listener()
     async def on_reaction_add(self, reaction: discord.Reaction, user: Union[discord.User, discord.Member]):
         g = reaction.message.guild
-        if not (g and await self._enabled(g)):
+        if not self._active(g):
             return
-        if not await self._cat(g, "reactions"):
+        ok, cat = await self._event_ctx(g, "reactions")
+        if not (ok and cat):
             return
         await self._send_embed(
             g,
             event_key="reaction",
             title="Reaction Added",
-            description=f"{u(user)} reacted in {chn(reaction.message.channel)}",
+            description=f"{user} (`{user.id}`) reacted in {reaction.message.channel.mention} (`{reaction.message.channel.id}`)",
             fields=[("Emoji", str(reaction.emoji), True), ("Message ID", f"`{reaction.message.id}`", True)],
         )
 
     @commands.Cog.listener()
     async def on_reaction_remove(self, reaction: discord.Reaction, user: Union[discord.User, discord.Member]):
         g = reaction.message.guild
-        if not (g and await self._enabled(g)):
+        if not self._active(g):
             return
-        if not await self._cat(g, "reactions"):
+        ok, cat = await self._event_ctx(g, "reactions")
+        if not (ok and cat):
             return
         await self._send_embed(
             g,
             event_key="reaction",
             title="Reaction Removed",
-            description=f"{u(user)} removed a reaction in {chn(reaction.message.channel)}",
+            description=f"{user} (`{user.id}`) removed a reaction in {reaction.message.channel.mention} (`{reaction.message.channel.id}`)",
             fields=[("Emoji", str(reaction.emoji), True), ("Message ID", f"`{reaction.message.id}`", True)],
         )
 
@@ -748,10 +1026,10 @@ class ModLogX(commands.Cog):
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member):
         g = member.guild
-        if not (await self._enabled(g)):
+        if not self._active(g):
             return
-        cats = await self._cat(g, "members")
-        if not cats or not cats.get("join", True):
+        ok, cats = await self._event_ctx(g, "members")
+        if not ok or not cats or not cats.get("join", True):
             return
         await self._send_embed(
             g,
@@ -765,10 +1043,10 @@ class ModLogX(commands.Cog):
     @commands.Cog.listener()
     async def on_member_remove(self, member: discord.Member):
         g = member.guild
-        if not (await self._enabled(g)):
+        if not self._active(g):
             return
-        cats = await self._cat(g, "members")
-        if not cats or not cats.get("leave", True):
+        ok, cats = await self._event_ctx(g, "members")
+        if not ok or not cats or not cats.get("leave", True):
             return
 
         # Detect kick
@@ -828,10 +1106,10 @@ class ModLogX(commands.Cog):
     @commands.Cog.listener()
     async def on_member_update(self, before: discord.Member, after: discord.Member):
         g = after.guild
-        if not (await self._enabled(g)):
+        if not self._active(g):
             return
-        cats = await self._cat(g, "members")
-        if not cats or not cats.get("update", True):
+        ok, cats = await self._event_ctx(g, "members")
+        if not ok or not cats or not cats.get("update", True):
             return
 
         # Role/nick
@@ -941,11 +1219,8 @@ class ModLogX(commands.Cog):
 
             actor = None
             if added or removed:
-                with contextlib.suppress(Exception):
-                    async for e in g.audit_logs(limit=5, action=discord.AuditLogAction.member_role_update):
-                        if e.target and e.target.id == after.id:
-                            actor = e.user
-                            break
+                entry = await self._await_audit(g, discord.AuditLogAction.member_role_update, after.id)
+                actor = entry.user if entry else None
 
             fields: List[Tuple[str, str, bool]] = [("User", f"{after.mention} ({after})", False)]
             if added:   fields.append(("Added", _role_mentions(added), False))
@@ -966,19 +1241,14 @@ class ModLogX(commands.Cog):
 
     @commands.Cog.listener()
     async def on_member_ban(self, guild: discord.Guild, user: Union[discord.User, discord.Member]):
-        if not (await self._enabled(guild)):
+        if not self._active(guild):
             return
-        cats = await self._cat(guild, "members")
-        if not cats or not cats.get("ban", True):
+        ok, cats = await self._event_ctx(guild, "members")
+        if not ok or not cats or not cats.get("ban", True):
             return
-        actor = None
-        reason = None
-        with contextlib.suppress(Exception):
-            async for entry in guild.audit_logs(limit=4, action=discord.AuditLogAction.ban):
-                if entry.target.id == user.id:
-                    actor = entry.user
-                    reason = entry.reason
-                    break
+        entry = await self._await_audit(guild, discord.AuditLogAction.ban, user.id)
+        actor = entry.user if entry else None
+        reason = entry.reason if entry else None
 
         created = getattr(user, "created_at", None)
         created_abs = discord.utils.format_dt(created, style="f") if created else "*unknown*"
@@ -1001,19 +1271,14 @@ class ModLogX(commands.Cog):
 
     @commands.Cog.listener()
     async def on_member_unban(self, guild: discord.Guild, user: Union[discord.User, discord.Member]):
-        if not (await self._enabled(guild)):
+        if not self._active(guild):
             return
-        cats = await self._cat(guild, "members")
-        if not cats or not cats.get("unban", True):
+        ok, cats = await self._event_ctx(guild, "members")
+        if not ok or not cats or not cats.get("unban", True):
             return
-        actor = None
-        reason = None
-        with contextlib.suppress(Exception):
-            async for entry in guild.audit_logs(limit=3, action=discord.AuditLogAction.unban):
-                if entry.target.id == user.id:
-                    actor = entry.user
-                    reason = entry.reason
-                    break
+        entry = await self._await_audit(guild, discord.AuditLogAction.unban, user.id)
+        actor = entry.user if entry else None
+        reason = entry.reason if entry else None
         await self._new_case(guild, action="unban", target=user, moderator=actor, reason=reason)
         await self._send_embed(
             guild,
@@ -1025,24 +1290,25 @@ class ModLogX(commands.Cog):
         )
 
     # ----- Roles -----
-    @commands.Cog.listener()
-    async def on_guild_role_create(self, role: discord.Role):
-        g = role.guild
-        if not (await self._enabled(g)) or not await self._cat(g, "roles"):
-            return
-        await self._send_embed(g, event_key="role", title="Role Created", description=role.mention, fields=[("Role ID", f"`{role.id}`", True)])
-
-    @commands.Cog.listener()
-    async def on_guild_role_delete(self, role: discord.Role):
-        g = role.guild
-        if not (await self._enabled(g)) or not await self._cat(g, "roles"):
-            return
-        await self._send_embed(g, event_key="role", title="Role Deleted", description=role.name, fields=[("Role ID", f"`{role.id}`", True)])
+    on_guild_role_create = _simple_listener(
+        "on_guild_role_create", "roles", "role", "Role Created",
+        lambda role: role.guild,
+        lambda role: (role.mention, [("Role ID", f"`{role.id}`", True)]),
+    )
+
+    on_guild_role_delete = _simple_listener(
+        "on_guild_role_delete", "roles", "role", "Role Deleted",
+        lambda role: role.guild,
+        lambda role: (role.name, [("Role ID", f"`{role.id}`", True)]),
+    )
 
     @commands.Cog.listener()
     async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
         g = after.guild
-        if not (await self._enabled(g)) or not await self._cat(g, "roles"):
+        if not self._active(g):
+            return
+        ok, cat = await self._event_ctx(g, "roles")
+        if not (ok and cat):
             return
         diffs = []
         if before.name != after.name:
@@ -1051,11 +1317,10 @@ class ModLogX(commands.Cog):
             diffs.append(f"**Color**: {before.color} → {after.color}")
         if before.mentionable != after.mentionable:
             diffs.append(f"**Mentionable**: {before.mentionable} → {after.mentionable}")
-        if before.permissions.value != after.permissions.value:
-            added_bits = after.permissions.value & ~before.permissions.value
-            removed_bits = before.permissions.value & ~after.permissions.value
-            added = [p for p, v in discord.Permissions(added_bits) if v]
-            removed = [p for p, v in discord.Permissions(removed_bits) if v]
+        changed = before.permissions.value ^ after.permissions.value
+        if changed:
+            added = _perm_names(changed & after.permissions.value)
+            removed = _perm_names(changed & before.permissions.value)
             if added:
                 diffs.append(f"**Perms Added**: {', '.join(added)}")
             if removed:
@@ -1071,25 +1336,27 @@ class ModLogX(commands.Cog):
         )
 
     # ----- Channels / Threads -----
-    @commands.Cog.listener()
-    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel):
-        g = channel.guild
-        if not (await self._enabled(g)) or not await self._cat(g, "channels"):
-            return
-        await self._send_embed(g, event_key="channel", title="Channel Created", description=chn(channel))
-
-    @commands.Cog.listener()
-    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
-        g = channel.guild
-        if not (await self._enabled(g)) or not await self._cat(g, "channels"):
-            return
-        name = getattr(channel, "name", "?")
-        await self._send_embed(g, event_key="channel", title="Channel Deleted", description=f"{name} (`{channel.id}`)")
+    on_guild_channel_create = _simple_listener(
+        "on_guild_channel_create", "channels", "channel", "Channel Created",
+        lambda channel: channel.guild,
+        lambda channel: (chn(channel), ()),
+    )
+
+    on_guild_channel_delete = _simple_listener(
+        "on_guild_channel_delete", "channels", "channel", "Channel Deleted",
+        lambda channel: channel.guild,
+        lambda channel: (f"{getattr(channel, 'name', '?')} (`{channel.id}`)", ()),
+    )
 
     @commands.Cog.listener()
     async def on_guild_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
         g = after.guild
-        if not (await self._enabled(g)) or not await self._cat(g, "channels"):
+        if not self._active(g):
+            return
+        if _channel_signature(before) == _channel_signature(after):
+            return
+        ok, cat = await self._event_ctx(g, "channels")
+        if not (ok and cat):
             return
         diffs = []
         if getattr(before, "name", None) != getattr(after, "name", None):
@@ -1116,17 +1383,21 @@ class ModLogX(commands.Cog):
             fields=[("Changes", "\n".join(diffs), False)],
         )
 
-    @commands.Cog.listener()
-    async def on_thread_create(self, thread: discord.Thread):
-        g = thread.guild
-        if not (await self._enabled(g)) or not await self._cat(g, "threads"):
-            return
-        await self._send_embed(g, event_key="thread", title="Thread Created", description=thread.name, fields=[("Parent", chn(thread.parent), True)])
+    on_thread_create = _simple_listener(
+        "on_thread_create", "threads", "thread", "Thread Created",
+        lambda thread: thread.guild,
+        lambda thread: (thread.name, [("Parent", chn(thread.parent), True)]),
+    )
 
     @commands.Cog.listener()
     async def on_thread_update(self, before: discord.Thread, after: discord.Thread):
         g = after.guild
-        if not (await self._enabled(g)) or not await self._cat(g, "threads"):
+        if not self._active(g):
+            return
+        if (before.name, before.archived, before.locked) == (after.name, after.archived, after.locked):
+            return
+        ok, cat = await self._event_ctx(g, "threads")
+        if not (ok and cat):
             return
         diffs = []
         if before.name != after.name:
@@ -1139,104 +1410,98 @@ class ModLogX(commands.Cog):
             return
         await self._send_embed(g, event_key="thread", title="Thread Updated", description=after.name, fields=[("Changes", "\n".join(diffs), False)])
 
-    @commands.Cog.listener()
-    async def on_thread_delete(self, thread: discord.Thread):
-        g = thread.guild
-        if not (await self._enabled(g)) or not await self._cat(g, "threads"):
-            return
-        await self._send_embed(g, event_key="thread", title="Thread Deleted", description=thread.name)
+    on_thread_delete = _simple_listener(
+        "on_thread_delete", "threads", "thread", "Thread Deleted",
+        lambda thread: thread.guild,
+        lambda thread: (thread.name, ()),
+    )
 
     # ----- Emojis / Stickers -----
-    @commands.Cog.listener()
-    async def on_guild_emojis_update(self, guild: discord.Guild, before, after):
-        if not (await self._enabled(guild)) or not await self._cat(guild, "emojis"):
-            return
-        await self._send_embed(guild, event_key="emoji", title="Emojis Updated", description=f"{len(before)} → {len(after)}")
-
-    @commands.Cog.listener()
-    async def on_guild_stickers_update(self, guild: discord.Guild, before, after):
-        if not (await self._enabled(guild)) or not await self._cat(guild, "stickers"):
-            return
-        await self._send_embed(guild, event_key="sticker", title="Stickers Updated", description=f"{len(before)} → {len(after)}")
+    on_guild_emojis_update = _simple_listener(
+        "on_guild_emojis_update", "emojis", "emoji", "Emojis Updated",
+        lambda guild, before, after: guild,
+        lambda guild, before, after: (f"{len(before)} → {len(after)}", ()),
+    )
+
+    on_guild_stickers_update = _simple_listener(
+        "on_guild_stickers_update", "stickers", "sticker", "Stickers Updated",
+        lambda guild, before, after: guild,
+        lambda guild, before, after: (f"{len(before)} → {len(after)}", ()),
+    )
 
     # ----- Invites / Webhooks / Integrations -----
-    @commands.Cog.listener()
-    async def on_invite_create(self, invite: discord.Invite):
-        g = invite.guild
-        if not (g and await self._enabled(g)) or not await self._cat(g, "invites"):
-            return
-        await self._send_embed(g, event_key="invite", title="Invite Created", description=f"`{invite.code}` for {chn(invite.channel)}")
-
-    @commands.Cog.listener()
-    async def on_invite_delete(self, invite: discord.Invite):
-        g = invite.guild
-        if not (g and await self._enabled(g)) or not await self._cat(g, "invites"):
-            return
-        await self._send_embed(g, event_key="invite", title="Invite Deleted", description=f"`{invite.code}`")
-
-    @commands.Cog.listener()
-    async def on_webhooks_update(self, channel: discord.abc.GuildChannel):
-        g = channel.guild
-        if not (await self._enabled(g)) or not await self._cat(g, "webhooks"):
-            return
-        await self._send_embed(g, event_key="webhook", title="Webhooks Updated", description=chn(channel))
-
-    @commands.Cog.listener()
-    async def on_integration_update(self, guild: discord.Guild):
-        if not (await self._enabled(guild)) or not await self._cat(guild, "integrations"):
-            return
-        await self._send_embed(guild, event_key="integration", title="Integrations Updated", description=guild.name)
+    on_invite_create = _simple_listener(
+        "on_invite_create", "invites", "invite", "Invite Created",
+        lambda invite: invite.guild,
+        lambda invite: (f"`{invite.code}` for {chn(invite.channel)}", ()),
+    )
+
+    on_invite_delete = _simple_listener(
+        "on_invite_delete", "invites", "invite", "Invite Deleted",
+        lambda invite: invite.guild,
+        lambda invite: (f"`{invite.code}`", ()),
+    )
+
+    on_webhooks_update = _simple_listener(
+        "on_webhooks_update", "webhooks", "webhook", "Webhooks Updated",
+        lambda channel: channel.guild,
+        lambda channel: (chn(channel), ()),
+    )
+
+    on_integration_update = _simple_listener(
+        "on_integration_update", "integrations", "integration", "Integrations Updated",
+        lambda guild: guild,
+        lambda guild: (guild.name, ()),
+    )
 
     # ----- Scheduled / Stage -----
-    @commands.Cog.listener()
-    async def on_guild_scheduled_event_create(self, event: discord.GuildScheduledEvent):
-        g = event.guild
-        if not (await self._enabled(g)) or not await self._cat(g, "scheduled_events"):
-            return
-        await self._send_embed(g, event_key="scheduled", title="Scheduled Event Created", description=event.name)
-
-    @commands.Cog.listener()
-    async def on_guild_scheduled_event_update(self, before: discord.GuildScheduledEvent, after: discord.GuildScheduledEvent):
-        g = after.guild
-        if not (await self._enabled(g)) or not await self._cat(g, "scheduled_events"):
-            return
-        await self._send_embed(g, event_key="scheduled", title="Scheduled Event Updated", description=after.name)
-
-    @commands.Cog.listener()
-    async def on_guild_scheduled_event_delete(self, event: discord.GuildScheduledEvent):
-        g = event.guild
-        if not (await self._enabled(g)) or not await self._cat(g, "scheduled_events"):
-            return
-        await self._send_embed(g, event_key="scheduled", title="Scheduled Event Deleted", description=event.name)
-
-    @commands.Cog.listener()
-    async def on_stage_instance_create(self, stage: discord.StageInstance):
-        g = stage.guild
-        if not (await self._enabled(g)) or not await self._cat(g, "stage"):
-            return
-        await self._send_embed(g, event_key="stage", title="Stage Created", description=stage.topic or "No topic")
-
-    @commands.Cog.listener()
-    async def on_stage_instance_update(self, before: discord.StageInstance, after: discord.StageInstance):
-        g = after.guild
-        if not (await self._enabled(g)) or not await self._cat(g, "stage"):
-            return
-        await self._send_embed(g, event_key="stage", title="Stage Updated", description=after.topic or "No topic")
-
-    @commands.Cog.listener()
-    async def on_stage_instance_delete(self, stage: discord.StageInstance):
-        g = stage.guild
-        if not (await self._enabled(g)) or not await self._cat(g, "stage"):
-            return
-        await self._send_embed(g, event_key="stage", title="Stage Deleted", description=stage.topic or "No topic")
+    on_guild_scheduled_event_create = _simple_listener(
+        "on_guild_scheduled_event_create", "scheduled_events", "scheduled", "Scheduled Event Created",
+        lambda event: event.guild,
+        lambda event: (event.name, ()),
+    )
+
+    on_guild_scheduled_event_update = _simple_listener(
+        "on_guild_scheduled_event_update", "scheduled_events", "scheduled", "Scheduled Event Updated",
+        lambda before, after: after.guild,
+        lambda before, after: (after.name, ()),
+    )
+
+    on_guild_scheduled_event_delete = _simple_listener(
+        "on_guild_scheduled_event_delete", "scheduled_events", "scheduled", "Scheduled Event Deleted",
+        lambda event: event.guild,
+        lambda event: (event.name, ()),
+    )
+
+    on_stage_instance_create = _simple_listener(
+        "on_stage_instance_create", "stage", "stage", "Stage Created",
+        lambda stage: stage.guild,
+        lambda stage: (stage.topic or "No topic", ()),
+    )
+
+    on_stage_instance_update = _simple_listener(
+        "on_stage_instance_update", "stage", "stage", "Stage Updated",
+        lambda before, after: after.guild,
+        lambda before, after: (after.topic or "No topic", ()),
+    )
+
+    on_stage_instance_delete = _simple_listener(
+        "on_stage_instance_delete", "stage", "stage", "Stage Deleted",
+        lambda stage: stage.guild,
+        lambda stage: (stage.topic or "No topic", ()),
+    )
 
     # ----- Voice / Presence / Guild -----
     @commands.Cog.listener()
     async def on_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState):
         g = member.guild
-        if not (await self._enabled(g)) or not await self._cat(g, "voice"):
+        if not self._active(g):
+            return
+        # mute/deafen toggles don't change any of these; drop them before touching config
+        if (before.channel, before.self_stream, before.self_video) == (after.channel, after.self_stream, after.self_video):
             return
-        if before.channel == after.channel and before.self_stream == after.self_stream and before.self_video == after.self_video:
+        ok, cat = await self._event_ctx(g, "voice")
+        if not (ok and cat):
             return
         desc = f"{u(member)}\n{chn(before.channel)} → {chn(after.channel)}"
         await self._send_embed(g, event_key="voice", title="Voice State Changed", description=desc, thumbnail_url=member.display_avatar.url)
@@ -1244,9 +1509,13 @@ class ModLogX(commands.Cog):
     @commands.Cog.listener()
     async def on_presence_update(self, before: discord.Member, after: discord.Member):
         g = after.guild
-        if not (await self._enabled(g)) or not await self._cat(g, "presence"):
+        if not self._active(g):
             return
-        if str(before.status) == str(after.status):
+        # activity-only presences: nothing to log
+        if before.status == after.status:
+            return
+        ok, cat = await self._event_ctx(g, "presence")
+        if not (ok and cat):
             return
         await self._send_embed(
             g,
@@ -1259,7 +1528,14 @@ class ModLogX(commands.Cog):
     @commands.Cog.listener()
     async def on_guild_update(self, before: discord.Guild, after: discord.Guild):
         g = after
-        if not (await self._enabled(g)) or not await self._cat(g, "server"):
+        if (before.name, before.afk_timeout) == (after.name, after.afk_timeout):
+            return
+        if before.name != after.name:
+            self._footer_text.pop(g.id, None)
+        if not self._active(g):
+            return
+        ok, cat = await self._event_ctx(g, "server")
+        if not (ok and cat):
             return
         diffs = []
         if before.name != after.name:
@@ -1274,10 +1550,13 @@ class ModLogX(commands.Cog):
     @commands.Cog.listener()
     async def on_audit_log_entry_create(self, entry: discord.AuditLogEntry):
         g = entry.guild
-        if not (g and await self._enabled(g)):
+        self._resolve_audit(entry)
+        if not self._active(g):
             return
-        cats = await self._cat(g, "automod")
-        if cats and cats.get("rules", True) and str(entry.action).startswith("AuditLogAction.auto_moderation_rule_"):
+        ok, cats = await self._event_ctx(g, "automod")
+        if not ok:
+            return
+        if cats and cats.get("rules", True) and entry.action in AUTOMOD_RULE_ACTIONS:
             await self._send_embed(
                 g,
                 event_key="automod_rules",
@@ -1289,10 +1568,10 @@ class ModLogX(commands.Cog):
 
     async def _on_automod_action_execution(self, payload):  # discord.py ≥2.6, if gateway exposes it
         g = getattr(payload, "guild", None) or self.bot.get_guild(getattr(payload, "guild_id", 0))
-        if not (g and await self._enabled(g)):
+        if not self._active(g):
             return
-        cats = await self._cat(g, "automod")
-        if not cats or not cats.get("execution", True):
+        ok, cats = await self._event_ctx(g, "automod")
+        if not ok or not cats or not cats.get("execution", True):
             return
         user = getattr(payload, "user", None)
         matched = getattr(payload, "matched_content", None) or getattr(payload, "content", None)
@@ -1307,10 +1586,26 @@ class ModLogX(commands.Cog):
         )
 
     # lifecycle
-    def cog_load(self):
+    async def cog_load(self):
+        for gid, d in (await self.config.all_guilds()).items():
+            if d.get("enabled", True) and d.get("webhook_url"):
+                self._enabled_guilds.add(gid)
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=10, ttl_dns_cache=300)
+        )
+        self._flusher_task = asyncio.create_task(self._flusher())
         with contextlib.suppress(Exception):
             self.bot.add_listener(self._on_automod_action_execution, "on_automod_action_execution")
 
-    def cog_unload(self):
+    async def cog_unload(self):
         with contextlib.suppress(Exception):
             self.bot.remove_listener(self._on_automod_action_execution, "on_automod_action_execution")
+        if self._flusher_task is not None:
+            self._flusher_task.cancel()
+            self._flusher_task = None
+            with contextlib.suppress(Exception):
+                await self._flush_queue()
+        self._webhooks.clear()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
@@ -1,19 +1,22 @@
-import discord
-
-try:
-    from pyrate_limiter import Duration, Limiter, Rate
-except ImportError:  # pyrate-limiter<3.0 exposed RequestRate instead of Rate
-    from pyrate_limiter import Duration, Limiter, RequestRate as Rate  # type: ignore[assignment]
-
-try:  # pyrate-limiter<=2 named the in-memory bucket MemoryListBucket
-    from pyrate_limiter import MemoryListBucket  # type: ignore[attr-defined]
-except ImportError:
-    try:
-        from pyrate_limiter.buckets import InMemoryBucket as MemoryListBucket  # type: ignore[attr-defined,assignment]
-    except ImportError:  # pragma: no cover - library missing optional bucket alias
-        MemoryListBucket = None  # type: ignore[assignment]
-from redbot.core import checks, commands, Config
-from redbot.core.bot import Red
+import asyncio
+import time
+
+import discord
+
+try:
+    from pyrate_limiter import Duration, Limiter, Rate
+except ImportError:  # pyrate-limiter<3.0 exposed RequestRate instead of Rate
+    from pyrate_limiter import Duration, Limiter, RequestRate as Rate  # type: ignore[assignment]
+
+try:  # pyrate-limiter<=2 named the in-memory bucket MemoryListBucket
+    from pyrate_limiter import MemoryListBucket  # type: ignore[attr-defined]
+except ImportError:
+    try:
+        from pyrate_limiter.buckets import InMemoryBucket as MemoryListBucket  # type: ignore[attr-defined,assignment]
+    except ImportError:  # pragma: no cover - library missing optional bucket alias
+        MemoryListBucket = None  # type: ignore[assignment]
+from redbot.core import checks, commands, Config
+from redbot.core.bot import Red
 
 ERROR_MESSAGES = {
     'NOTIF_UNRECOGNIZED': "Notification Key was not recognized, please do `!notifs info` to get more info about the keys. List of valid keys: kick, ban, mute, jail, warn, channelperms, editchannel, deletemessages, ratelimit, adminrole, bot",
@@ -32,6 +35,9 @@ PERM_SYS_INFO = """
 **DeleteMessages:** Can Delete and Pin Messages. (50 per hour max)
 """
 
+# Seconds a user fetched over REST (not in the bot's cache) is reused for notifications
+FETCHED_USER_TTL = 3600
+
 NOTIF_SYS_INFO = """
 **__Notification System Information__**
 You will be DMed on the events that you choose, listed below:
@@ -49,12 +55,12 @@ You will be DMed on the events that you choose, listed below:
 """
 
 
-class ModPlus(commands.Cog):
-    """Ultimate Moderation Cog for RedBot"""
-
-    def __init__(self, bot: Red) -> None:
-        self.bot = bot
-        self.config = Config.get_conf(self, 8818154, force_registration=True)
+class ModPlus(commands.Cog):
+    """Ultimate Moderation Cog for RedBot"""
+
+    def __init__(self, bot: Red) -> None:
+        self.bot = bot
+        self.config = Config.get_conf(self, 8818154, force_registration=True)
         # PyRateLimit.init(redis_host="localhost", redis_port=6379)
         hourly_rate5 = Rate(5, Duration.HOUR)
         hourly_rate3 = Rate(3, Duration.HOUR)
@@ -144,6 +150,29 @@ class ModPlus(commands.Cog):
             'jailed',
             'muted'
         ]
+        # guild id -> ids of roles carrying administrator, rebuilt lazily after role changes
+        self._admin_role_ids = {}
+        # in-memory mirrors of the global notif config, loaded in cog_load
+        self._notifs = {key: set() for key in self.notifkeys}
+        self._notifchannels = {key: set() for key in self.notifkeys}
+        # user id -> (fetched at, user) for subscribers missing from the bot's cache
+        self._fetched_users = {}
+
+    async def cog_load(self):
+        for key, userids in (await self.config.notifs()).items():
+            self._notifs[key] = set(userids)
+        for key, channels in (await self.config.notifchannels()).items():
+            self._notifchannels[key] = {tuple(channel) for channel in channels}
+
+    async def save_notifs(self, notifkey):
+        """Write a single notif key back to config"""
+        await self.config.notifs.set_raw(notifkey, value=list(self._notifs[notifkey]))
+
+    async def save_notifchannels(self, notifkey):
+        """Write a single channel notif key back to config"""
+        await self.config.notifchannels.set_raw(
+            notifkey, value=[list(channel) for channel in self._notifchannels[notifkey]]
+        )
 
     # Notifications Part
 
@@ -172,13 +201,11 @@ class ModPlus(commands.Cog):
         if notifkey not in self.notifkeys:
             return await ctx.send(ERROR_MESSAGES['NOTIF_UNRECOGNIZED'])
 
-        data = await self.config.notifs()
-        if user.id in data[notifkey]:
+        if user.id in self._notifs[notifkey]:
             return await ctx.send(f"{user.display_name} is already getting notified about {notifkey}")
 
-
-        data[notifkey].append(user.id)
-        await self.config.notifs.set(data)
+        self._notifs[notifkey].add(user.id)
+        await self.save_notifs(notifkey)
         return await ctx.send(f"{user.display_name} will now be notified on {notifkey}")
 
     @adminnotifications.command(name='remove')
@@ -190,12 +217,11 @@ class ModPlus(commands.Cog):
         if notifkey not in self.notifkeys:
             return await ctx.send(ERROR_MESSAGES['NOTIF_UNRECOGNIZED'])
 
-        data = await self.config.notifs()
-        if user.id not in data[notifkey]:
+        if user.id not in self._notifs[notifkey]:
             return await ctx.send(f"{user.display_name} isn't currently getting notified about {notifkey}")
-        
-        data[notifkey].remove(user.id)
-        await self.config.notifs.set(data)
+
+        self._notifs[notifkey].discard(user.id)
+        await self.save_notifs(notifkey)
         return await ctx.send(f"{user.display_name} will now stop being notified about {notifkey}")
 
     # SHOW NOTIFICATIONS
@@ -204,11 +230,7 @@ class ModPlus(commands.Cog):
         """Show which notifications you / a user has enabled"""
         if user is None:
             user = ctx.author
-        data = await self.config.notifs()
-        notifs = []
-        for notif in data:
-            if user.id in data[notif]:
-                notifs.append(notif)
+        notifs = [notif for notif, userids in self._notifs.items() if user.id in userids]
         await ctx.send(f'{user.display_name} is getting notified for the following: ' + ', '.join(notifs))
 
     # Channel notifications
@@ -219,13 +241,12 @@ class ModPlus(commands.Cog):
         if notifkey not in self.notifkeys:
             return await ctx.send(ERROR_MESSAGES['NOTIF_UNRECOGNIZED'])
 
-        data = await self.config.notifchannels()
-        channeldata = [channel.guild.id, channel.id]
-        if channeldata in data[notifkey]:
+        channeldata = (channel.guild.id, channel.id)
+        if channeldata in self._notifchannels[notifkey]:
             return await ctx.send(f"{channel.name} is already getting notified about {notifkey}")
 
-        data[notifkey].append(channeldata)
-        await self.config.notifchannels.set(data)
+        self._notifchannels[notifkey].add(channeldata)
+        await self.save_notifchannels(notifkey)
         return await ctx.send(f"{channel.name} will now be notified on {notifkey}")
 
     @notifschannel.command(name='remove')
@@ -235,49 +256,72 @@ class ModPlus(commands.Cog):
         if notifkey not in self.notifkeys:
             return await ctx.send(ERROR_MESSAGES['NOTIF_UNRECOGNIZED'])
 
-        data = await self.config.notifchannels()
-        channeldata = [channel.guild.id, channel.id]
-        if channeldata not in data[notifkey]:
+        channeldata = (channel.guild.id, channel.id)
+        if channeldata not in self._notifchannels[notifkey]:
             return await ctx.send(f"{channel.name} isn't currently getting notified about {notifkey}")
-        
-        data[notifkey].remove(channeldata)
-        await self.config.notifchannels.set(data)
+
+        self._notifchannels[notifkey].discard(channeldata)
+        await self.save_notifchannels(notifkey)
         return await ctx.send(f"{channel.name} will now stop being notified about {notifkey}")
 
     @notifschannel.command(name='list')
     async def channelnotifslist(self, ctx, channel: discord.TextChannel):
         """Show which notifications a channel has enabled"""
-        data = await self.config.notifchannels()
-        channeldata = [channel.guild.id, channel.id]
-        notifs = []
-        for notif in data:
-            if channeldata in data[notif]:
-                notifs.append(notif)
+        channeldata = (channel.guild.id, channel.id)
+        notifs = [notif for notif, channels in self._notifchannels.items() if channeldata in channels]
         await ctx.send(f'{channel.name} is getting notified for the following: ' + ', '.join(notifs))
     
 
     # NOTIFY FUNCTION
+    async def resolve_user(self, userid: int) -> discord.User:
+        """Get a user from the bot cache, falling back to a rate-limited REST fetch"""
+        user = self.bot.get_user(userid)
+        if user is not None:
+            return user
+        hit = self._fetched_users.get(userid)
+        if hit is not None and time.monotonic() - hit[0] < FETCHED_USER_TTL:
+            return hit[1]
+        user = await self.bot.fetch_user(userid)
+        self._fetched_users[userid] = (time.monotonic(), user)
+        return user
+
+    async def _dm(self, userid: int, payload):
+        user: discord.User = await self.resolve_user(userid)
+        await user.send(payload)
+
     async def notify(self, notifkey, payload):
-        data = await self.config.all()
-        for userid in data['notifs'][notifkey]:
-            user: discord.User = await self.bot.fetch_user(userid)
-            try:
-                await user.send(payload)
-            except Exception:
-                pass
-        for channel in data['notifchannels'][notifkey]:
-            guild: discord.Guild = self.bot.get_guild(channel[0])
-            if guild is not None:
-                txtchannel = guild.get_channel(channel[1])
-            try:
-                await txtchannel.send(payload, allowed_mentions=discord.AllowedMentions.all())
-            except Exception:
-                pass
+        sends = [self._dm(userid, payload) for userid in self._notifs.get(notifkey, ())]
+        for channel in self._notifchannels.get(notifkey, ()):
+            guild: discord.Guild = self.bot.get_guild(channel[0])
+            txtchannel = guild.get_channel(channel[1]) if guild is not None else None
+            if txtchannel is None:
+                continue
+            sends.append(txtchannel.send(payload, allowed_mentions=discord.AllowedMentions.all()))
+        # Failures (closed DMs, missing perms) are dropped per recipient, as before
+        await asyncio.gather(*sends, return_exceptions=True)
 
 
     # Admin Logging
+    def admin_role_ids(self, guild: discord.Guild) -> set:
+        """Return the cached set of administrator role ids for a guild"""
+        ids = self._admin_role_ids.get(guild.id)
+        if ids is None:
+            ids = {role.id for role in guild.roles if role.permissions.administrator}
+            self._admin_role_ids[guild.id] = ids
+        return ids
+
+    @commands.Cog.listener(name='on_guild_role_create')
+    async def role_create_admin_cache(self, role: discord.Role):
+        self._admin_role_ids.pop(role.guild.id, None)
+
+    @commands.Cog.listener(name='on_guild_role_delete')
+    async def role_delete_admin_cache(self, role: discord.Role):
+        self._admin_role_ids.pop(role.guild.id, None)
+
     @commands.Cog.listener(name='on_guild_role_update')
     async def role_add_admin(self, old: discord.Role, new: discord.Role):
+        if old.permissions.administrator != new.permissions.administrator:
+            self._admin_role_ids.pop(new.guild.id, None)
         if new.permissions.administrator and not old.permissions.administrator:
             await self.notify('adminrole', f'@everyone Role {new.mention}({new.id}) was updated to contain administrator permission. \n IN: {old.guild.name}({old.guild.id})')
 
@@ -289,38 +333,41 @@ class ModPlus(commands.Cog):
     
     @commands.Cog.listener(name='on_member_update')
     async def member_admin(self, old: discord.Member, new: discord.Member):
-        new_roles = []
-        for role in new.roles:
-            if role not in old.roles:
-                new_roles.append(role)
-        for role in new_roles:
-            if role.permissions.administrator:
-                await self.notify('adminrole', f'@everyone Member{new.mention}({new.id}) was updated to contain administrator permission. \n IN: {old.guild.name}({old.guild.id})')
+        added = {role.id for role in new.roles} - {role.id for role in old.roles}
+        if added and not added.isdisjoint(self.admin_role_ids(new.guild)):
+            await self.notify('adminrole', f'@everyone Member{new.mention}({new.id}) was updated to contain administrator permission. \n IN: {old.guild.name}({old.guild.id})')
 
 
     async def rate_limit_exceeded(self, user: discord.Member, type):
         """Called to removed all moderation roles when a mod has hit ratelimit"""
-        allmodroles = []
         data = await self.config.guild(user.guild).perms()
-        for perm in data:
-            for role in data[perm]:
-                if role not in allmodroles:
-                    allmodroles.append(role)
-        rm_mention = []
-        broken = []
-        issue = False
+        allmodroles = {role for roles in data.values() for role in roles}
+        to_remove = []
+        unremovable = []
+        top_role = user.guild.me.top_role
         for role in user.roles:
             if role.id in allmodroles:
-                try:
-                    await user.remove_roles(role, reason='Rate limit exceeded.')
-                    rm_mention.append(role.mention)
-                    rm_mention.append('(' + str(role.id) + ')')
-                except Exception:
-                    issue = True
-                    broken.append(role.mention)
-                    broken.append('(' + str(role.id) + ')')
-            
-        if issue:
+                if role.managed or role >= top_role:
+                    unremovable.append(role)
+                else:
+                    to_remove.append(role)
+        if to_remove:
+            try:
+                # atomic=False: a single PATCH with the final role list, so either every role goes or none does
+                await user.remove_roles(*to_remove, reason='Rate limit exceeded.', atomic=False)
+            except Exception:
+                unremovable.extend(to_remove)
+                to_remove = []
+        rm_mention = []
+        for role in to_remove:
+            rm_mention.append(role.mention)
+            rm_mention.append('(' + str(role.id) + ')')
+        broken = []
+        for role in unremovable:
+            broken.append(role.mention)
+            broken.append('(' + str(role.id) + ')')
+
+        if broken:
             await self.notify('ratelimit', "Removing roles in the ratelimit below ended in error. The user has a role above the bot. The following roles could not be removed: " + ', '.join(broken))
         payload = f"@everyone {type} ratelimit has been exceeded by {user.mention} ({user.display_name}, {user.id}). The following roles with power have been removed: " + ', '.join(rm_mention)
         await self.notify('ratelimit', payload)
@@ -329,10 +376,10 @@ class ModPlus(commands.Cog):
     async def action_check(self, ctx, permkey):
         if await self.bot.is_admin(ctx.author) or await self.bot.is_owner(ctx.author) or ctx.author.guild_permissions.administrator: # Admin auto-bypass
             return True
-        data = await self.config.guild(ctx.guild).all()
+        permroles = set(await self.config.guild(ctx.guild).perms.get_raw(permkey, default=[]))
         canrun = False
         for role in ctx.author.roles:
-            if role.id in data['perms'][permkey]:
+            if role.id in permroles:
                 canrun = True
                 break
         if not canrun:
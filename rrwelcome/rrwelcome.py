@@ -2,74 +2,107 @@ import discord
 from redbot.core import commands
 from redbot.core.bot import Red
 
+WELCOME_EMBED = {
+    "title": "Welcome to Threat Level!",
+    "description": "Please read the following carefully to avoid your removal from the server!\n\n"
+    "To help us keep the inactive members out of your server, you'll need to select a role(s) from the ones available to avoid being kicked. If you don't select anything, you'll be kicked (not banned) after one week.\n\n"
+    "If you experience any issues with this, feel free to ping an online staff member to get you into our server.\n\n"
+    "Note: Clicking the first 3 options will also open up the server. So you won't need to click 'Join a club' and 'Join the Community' at the same time!",
+    "footer": {"text": "Threat Level - 2025"},
+}
+
+ROLES_EMBED = {
+    "title": "Please enjoy each button press equally!",
+    "fields": [
+        {"name": "Want to join a Clash Royale clan?", "value": "Click 'Join a Clan!' below to be taken to our recruitment channel.", "inline": False},
+        {"name": "Want to join a Brawl Stars club?", "value": "Click 'Join a Club!' below to be taken our recruitment channel.", "inline": False},
+        {"name": "Looking for a Minecraft Server to join?", "value": "Click 'Join the Craft!' below to be taken to the UTS Minecraft Server information channel.", "inline": False},
+        {"name": "Just looking to be apart of our community?", "value": "Click 'Join the community!' below to open up our server!", "inline": False},
+    ],
+    "footer": {"text": "Threat Level - 2025"},
+}
+
 class ReactRoleWelcome(commands.Cog):
     def __init__(self, bot: Red):
         self.bot = bot
 
     async def cog_load(self):
-        self.bot.add_view(ReactRoleView()) # Makes button persistent through restarts
-    
+        # The welcome message never changes, so build it once and reuse it for every send
+        self._welcome_embed, self._roles_embed = self.build_welcome_embeds()
+        self._welcome_view = ReactRoleView()
+        self.bot.add_view(self._welcome_view) # Makes button persistent through restarts
+
+    @staticmethod
+    def build_welcome_embeds():
+        return discord.Embed.from_dict(WELCOME_EMBED), discord.Embed.from_dict(ROLES_EMBED)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        self._welcome_view.role_cache.pop(role.id, None)
+
     @commands.command()
     @commands.admin()
     async def welcome(self, ctx):
-        e = discord.Embed(
-            title = "Welcome to Threat Level!",
-            description = "Please read the following carefully to avoid your removal from the server!\n\n"
-            "To help us keep the inactive members out of your server, you'll need to select a role(s) from the ones available to avoid being kicked. If you don't select anything, you'll be kicked (not banned) after one week.\n\n"
-            "If you experience any issues with this, feel free to ping an online staff member to get you into our server.\n\n"
-            "Note: Clicking the first 3 options will also open up the server. So you won't need to click 'Join a club' and 'Join the Community' at the same time!"
-        )
-        a = discord.Embed(
-            title = "Please enjoy each button press equally!"
-        )
-        a.add_field(name = "Want to join a Clash Royale clan?", value = "Click 'Join a Clan!' below to be taken to our recruitment channel.", inline = False)
-        a.add_field(name = "Want to join a Brawl Stars club?", value = "Click 'Join a Club!' below to be taken our recruitment channel.", inline = False)
-        a.add_field(name = "Looking for a Minecraft Server to join?", value = "Click 'Join the Craft!' below to be taken to the UTS Minecraft Server information channel.", inline = False)
-        a.add_field(name = "Just looking to be apart of our community?", value = "Click 'Join the community!' below to open up our server!", inline = False)
-
-        e.set_footer(text = "Threat Level - 2025")
-        a.set_footer(text = "Threat Level - 2025")
+        await ctx.send(embed = self._welcome_embed)
+        await ctx.send(embed = self._roles_embed, view = self._welcome_view)
 
-        view = ReactRoleView()
-        await ctx.send(embed = e)
-        await ctx.send(embed = a, view = view)
+def multi_custom_id(role_ids):
+    return f"multi_{'_'.join(str(r) for r in role_ids)}"
 
 class ReactRoleView(discord.ui.View):
+    # (label, role ids, custom_id) - custom_ids are fixed so the persistent view keeps matching old messages
+    BUTTONS = tuple(
+        (label, role_ids, multi_custom_id(role_ids))
+        for label, role_ids in (
+            ("Join a Clan!", [1405139477705261056, 1418925222345707644]),
+            ("Join a Club!", [1405139477705261056, 1418925387018141706]),
+            ("Join the Craft!", [1405139477705261056, 1418925441279983677]),
+            ("Join the Community!", [1405139477705261056]),
+        )
+    )
+
     def __init__(self):
         super().__init__(timeout=None)
+        # role id -> Role, shared by every button (they all give the same base role); dropped on role delete
+        self.role_cache: dict[int, discord.Role] = {}
 
-        self.add_item(ReactRoleButton("Join a Clan!", [1405139477705261056, 1418925222345707644]))
-        self.add_item(ReactRoleButton("Join a Club!", [1405139477705261056, 1418925387018141706]))
-        self.add_item(ReactRoleButton("Join the Craft!", [1405139477705261056, 1418925441279983677]))
-        self.add_item(ReactRoleButton("Join the Community!", [1405139477705261056]))
+        for label, role_ids, custom_id in self.BUTTONS:
+            self.add_item(ReactRoleButton(label, role_ids, custom_id))
 
 class ReactRoleButton(discord.ui.Button):
-    def __init__(self, label: str, role_ids: list[int]):
-        super().__init__(label = label, style = discord.ButtonStyle.success, custom_id = f"multi_{'_'.join(str(r) for r in role_ids)}",)
+    def __init__(self, label: str, role_ids: list[int], custom_id: str = None):
+        super().__init__(label = label, style = discord.ButtonStyle.success, custom_id = custom_id or multi_custom_id(role_ids),)
         self.role_ids = role_ids
 
     async def callback(self, interaction: discord.Interaction):
         member = interaction.user
         guild = interaction.guild
 
-        added, removed = [], []
+        to_add, to_remove = [], []
 
+        role_cache = self.view.role_cache
         for r in self.role_ids:
-            role = guild.get_role(r)
+            role = role_cache.get(r)
             if role is None:
-                continue
-            if role in member.roles:
-                await member.remove_roles(role, reason = "User requested action via Welcome Reaction Role")
-                removed.append(role.name)
+                role = guild.get_role(r)
+                if role is None:
+                    continue
+                role_cache[r] = role
+            if member.get_role(r) is not None:
+                to_remove.append(role)
             else:
-                await member.add_roles(role, reason = "User requested action via Welcome Reaction Role")
-                added.append(role.name)
-            
+                to_add.append(role)
+
+        # Final role list built once and sent as a single member edit (add_roles/remove_roles send one request per role)
+        if to_add or to_remove:
+            new_roles = [role for role in member.roles if role not in to_remove and not role.is_default()] + to_add
+            await member.edit(roles = new_roles, reason = "User requested action via Welcome Reaction Role")
+
         msg = []
-        if added:
-            msg.append(f"Added {' and '.join(added)}! Welcome to Threat Level!")
-        if removed:
-            msg.append(f"Removed {' and '.join(removed)}")
+        if to_add:
+            msg.append(f"Added {' and '.join(role.name for role in to_add)}! Welcome to Threat Level!")
+        if to_remove:
+            msg.append(f"Removed {' and '.join(role.name for role in to_remove)}")
         
         if not msg:
             msg = ["Sorry, I can't add role that don't exist. Ping a staff member to get this sorted for you."]
@@ -1,21 +1,39 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
+import logging
 import random
 import calendar
 
 import discord
-from discord.ext import tasks
 from redbot.core import commands, Config
 from redbot.core.bot import Red
 
+log = logging.getLogger("red.cogs.sandwich")
 
 
-# Duane's userID
-duaneuid = 506325350335119360
+# Reminder sends in flight at once during the daily roll
+SEND_CONCURRENCY = 8
+
+
+def month_key(when: datetime.datetime) -> int:
+    """Month as an int, e.g. 2025-03 -> 202503"""
+    return when.year * 100 + when.month
+
+
+def stored_month_key(value) -> int | None:
+    """Read a stored current_month, migrating the old "YYYY-MM" string form"""
+    if isinstance(value, str):
+        year, month = value.split("-")
+        return int(year) * 100 + int(month)
+    return value
 
 
 class sandwich(commands.Cog):
+    # Duane's userID
+    DUANE_UID = 506325350335119360
+
     def __init__(self, bot: Red):
         self.bot = bot
         self.config = Config.get_conf(
@@ -25,80 +43,124 @@ class sandwich(commands.Cog):
         default_guild = {
             "channel_id": None,
             "current_month": None,
+            # Days of current_month still due a reminder; None until the month is scheduled
+            "scheduled_days": None,
+            # Legacy send counter, only read to schedule the rest of a month started before scheduled_days
             "sent_this_month": 0,
         }
 
         self.config.register_guild(**default_guild)
-        self.monthly_loop.start()
+        self._runner_task: asyncio.Task | None = None
+        # Guilds with a reminder channel set; the daily roll only visits these
+        self._active_guilds: set[int] = set()
+
+    async def cog_load(self):
+        for guild_id, data in (await self.config.all_guilds()).items():
+            if data.get("channel_id"):
+                self._active_guilds.add(int(guild_id))
+        self._runner_task = asyncio.create_task(self._runner())
 
     def cog_unload(self):
-        self.monthly_loop.cancel()
+        if self._runner_task is not None:
+            self._runner_task.cancel()
 
-    # Background task runs once a day
-    @tasks.loop(hours=24)
-    async def monthly_loop(self):
-        today = datetime.datetime.utcnow()
-        current_month = today.strftime("%Y-%m")
+    # Background task: sleeps until each UTC midnight, then runs the daily roll once
+    async def _runner(self):
+        await self.bot.wait_until_red_ready()
+        while True:
+            now = datetime.datetime.now(datetime.timezone.utc)
+            next_tick = datetime.datetime.combine(
+                now.date() + datetime.timedelta(days=1), datetime.time(0, 0), tzinfo=datetime.timezone.utc
+            )
+            await asyncio.sleep((next_tick - now).total_seconds())
+            # Roll for the day we slept until, even if the timer fires a hair early
+            try:
+                await self.monthly_loop(next_tick)
+            except Exception:
+                # One bad roll (e.g. a failed Config write) must not end the runner
+                log.exception("Sandwich daily roll failed")
+
+    async def monthly_loop(self, today: datetime.datetime | None = None):
+        if today is None:
+            today = datetime.datetime.now(datetime.timezone.utc)
+        current_month = month_key(today)
         _, days_in_month = calendar.monthrange(today.year, today.month)
-        day_of_month = today.day
-
-        guild_data = await self.config.all_guilds()
+        day = today.day
+        duane_uid = self.DUANE_UID
+        sem = asyncio.Semaphore(SEND_CONCURRENCY)
+        sends = []
+
+        for guild_id in tuple(self._active_guilds):
+            guild = self.bot.get_guild(guild_id)
+            if not guild or guild.unavailable:
+                continue
+            # Cached member check first: no point reading Config if Duane isn't here
+            user = guild.get_member(duane_uid)
+            if not user:
+                continue
 
-        for guild_id, data in guild_data.items():
+            g = self.config.guild(guild)
+            data = await g.all()
             channel_id = data.get("channel_id")
             if not channel_id:
-                continue
-
-            guild = self.bot.get_guild(int(guild_id))
-            if not guild:
+                self._active_guilds.discard(guild_id)
                 continue
 
             channel = guild.get_channel(channel_id)
-            user = guild.get_member(duaneuid)
-            if not channel or not user:
-                continue
-
-            stored_month = data.get("current_month")
-            sent = int(data.get("sent_this_month", 0))
-
-            # Reset on new month
-            if stored_month != current_month:
-                sent = 0
-                await self.config.guild(guild).current_month.set(current_month)
-                await self.config.guild(guild).sent_this_month.set(0)
-
-            if sent >= 3:
+            if not channel:
+                # Reminder channel was deleted: forget it so the guild drops out of the daily roll
+                await g.channel_id.set(None)
+                self._active_guilds.discard(guild_id)
                 continue
 
-            remaining_days = days_in_month - day_of_month + 1
-            remaining_needed = 3 - sent
-            probability = remaining_needed / remaining_days
-
-            if random.random() <= probability:
-                try:
-                    await channel.send(f"{user.mention} go make a sandwich.")
-                except discord.HTTPException:
-                    pass
-
-                sent += 1
-                await self.config.guild(guild).sent_this_month.set(sent)
-
-    @monthly_loop.before_loop
-    async def before_loop(self):
-        await self.bot.wait_until_red_ready()
+            new_month = stored_month_key(data.get("current_month")) != current_month
+            days = None if new_month else data.get("scheduled_days")
+            scheduled = days is None
+            if scheduled:
+                # Pick this month's remaining reminder days once instead of rolling every day
+                sent = 0 if new_month else int(data.get("sent_this_month", 0))
+                pool = range(day, days_in_month + 1)
+                days = sorted(random.sample(pool, max(0, min(3 - sent, len(pool)))))
+
+            # any scheduled day up to today is due, so a day missed while offline is caught up (once)
+            remaining = [d for d in days if d > day]
+            if len(remaining) < len(days):
+                days = remaining
+                # Sent after the loop so one guild's rate limit doesn't hold up the others
+                sends.append(self._send_and_record(sem, g, channel, user, current_month, days))
+            elif scheduled:
+                await self._record(g, current_month, days)
+
+        await asyncio.gather(*sends, return_exceptions=True)
+
+    async def _send_and_record(self, sem, g, channel, user, current_month, days):
+        async with sem:
+            try:
+                await channel.send(f"{user.mention} go make a sandwich.")
+            except discord.HTTPException:
+                pass
+        await self._record(g, current_month, days)
+
+    async def _record(self, g, current_month, days):
+        # One write for the month and its remaining days together
+        async with g.all() as gdata:
+            gdata["current_month"] = current_month
+            gdata["scheduled_days"] = days
 
     @commands.command()
     @commands.guild_only()
     async def sandwich(self, ctx: commands.Context):
         """Sets the channel where the sandwich reminders will be sent."""
-        await self.config.guild(ctx.guild).channel_id.set(ctx.channel.id)
-
-        now = datetime.datetime.utcnow().strftime("%Y-%m")
-        await self.config.guild(ctx.guild).current_month.set(now)
-        await self.config.guild(ctx.guild).sent_this_month.set(0)
+        now = month_key(datetime.datetime.now(datetime.timezone.utc))
+        async with self.config.guild(ctx.guild).all() as gdata:
+            gdata["channel_id"] = ctx.channel.id
+            gdata["current_month"] = now
+            gdata["sent_this_month"] = 0
+            gdata["scheduled_days"] = None # scheduled on the next daily roll
+        self._active_guilds.add(ctx.guild.id)
 
         await ctx.send(
-            f"Okay, I'll remind <@{duaneuid}> **3 times a month** to go make a sandwich"
+            f"Okay, I'll remind <@{self.DUANE_UID}> **3 times a month** to go make a sandwich"
         )
 
 
@@ -11,9 +11,10 @@
 # This cog stores no personal user data.
 
 from __future__ import annotations
-import asyncio, time, copy
+import asyncio, time, copy, sys
+from itertools import islice
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, NamedTuple, Optional, Tuple, Any
 
 import discord
 from discord import ui
@@ -27,55 +28,96 @@ ADMIN_ANCHOR_NAME = "ADMIN"  # anchor role; never moved by this cog
 CATEGORY_SCOPE: List[str] = []  # e.g., ["Revamp • Announcements", "Revamp • Community"]
 
 # ---------- helpers ----------
-def _norm(s: str) -> str: return (s or "").strip().lower()
+# zero-width characters Discord allows in names but nobody can see
+_ZERO_WIDTH = dict.fromkeys(map(ord, "\u200b\u200c\u200d\u2060\ufeff"))
+
+def _norm(s: str) -> str: return (s or "").translate(_ZERO_WIDTH).strip().casefold()
+
+_ADMIN_ANCHOR_KEY = _norm(ADMIN_ANCHOR_NAME)
+
+_ICON_MAP = {
+    "ready": "🟡", "start": "🟡", "lock": "🔒", "roles": "👤",
+    "cats": "🗂️", "chans": "📺", "overwrites": "🔐",
+    "threads": "🧵", "unlock": "🔓", "done": "✅", "rollback": "↩️"
+}
 
 def _icon(step: str) -> str:
-    return {
-        "ready": "🟡", "start": "🟡", "lock": "🔒", "roles": "👤",
-        "cats": "🗂️", "chans": "📺", "overwrites": "🔐",
-        "threads": "🧵", "unlock": "🔓", "done": "✅", "rollback": "↩️"
-    }.get(step, "🔧")
+    return _ICON_MAP.get(step, "🔧")
 
-# Minimal role shape for diffs
-def _strip_role(r: discord.Role) -> dict:
+# Minimal role shape for diffs (a tuple: plans hold one per role)
+class RoleSnap(NamedTuple):
+    name: str
+    color: int
+    hoist: bool
+    mentionable: bool
+    permissions: int
+
+def _strip_role(r: discord.Role) -> RoleSnap:
+    return RoleSnap(r.name, r.color.value, r.hoist, r.mentionable, r.permissions.value)
+
+# Compared straight off the two live roles: no snapshot built per matched role
+def _role_diff(tgt: discord.Role, src: discord.Role) -> Tuple[bool, dict]:
+    ch = {}
+    if tgt.color.value != src.color.value:
+        ch["color"] = {"from": tgt.color.value, "to": src.color.value}
+    if tgt.hoist != src.hoist:
+        ch["hoist"] = {"from": tgt.hoist, "to": src.hoist}
+    if tgt.mentionable != src.mentionable:
+        ch["mentionable"] = {"from": tgt.mentionable, "to": src.mentionable}
+    if tgt.permissions.value != src.permissions.value:
+        ch["permissions"] = {"from": tgt.permissions.value, "to": src.permissions.value}
+    return bool(ch), ch
+
+# Role.edit kwargs for the planned changes that still differ on the live role
+def _role_patch(changes: dict, role: discord.Role) -> dict:
+    current = _strip_role(role)
+    patch = {}
+    for k, change in changes.items():
+        want = change["to"]
+        if getattr(current, k) == want:
+            continue
+        if k == "color":
+            patch["colour"] = discord.Colour(want)
+        elif k == "permissions":
+            patch["permissions"] = discord.Permissions(want)
+        else:
+            patch[k] = want
+    return patch
+
+# Trimmed channel signature for change detection (ignores overwrites; perms mirrored later).
+# Attributes a channel type lacks read as their defaults, so two channels differ only on what they have.
+def _chan_sig(ch) -> tuple:
+    cat = ch.category
+    return (
+        ch.type,
+        bool(getattr(ch, "nsfw", False)),
+        int(getattr(ch, "slowmode_delay", 0) or 0),
+        getattr(ch, "topic", None) or "",
+        _norm(cat.name) if cat else None,  # normalised like the match key, so case-only differences aren't updates
+    )
+
+# Match key for a non-category channel: (normalised name, type, normalised parent name or None)
+def _chan_key(ch) -> Tuple[str, discord.ChannelType, Optional[str]]:
+    cat = ch.category
+    return _norm(ch.name), ch.type, (_norm(cat.name) if cat else None)
+
+# key -> first target channel with it; one pass instead of a scan per source channel
+def _chan_index(chans) -> Dict[Tuple[str, discord.ChannelType, Optional[str]], discord.abc.GuildChannel]:
+    index = {}
+    for c in chans:
+        index.setdefault(_chan_key(c), c)
+    return index
+
+# Mirrored channel settings, read once per channel (missing attributes fall back to defaults)
+def _chan_fields(ch) -> dict:
     return {
-        "name": r.name, "key": _norm(r.name), "color": r.color.value,
-        "hoist": r.hoist, "mentionable": r.mentionable, "permissions": r.permissions.value
+        "topic": getattr(ch, "topic", None),
+        "nsfw": bool(getattr(ch, "nsfw", False)),
+        "slowmode": int(getattr(ch, "slowmode_delay", 0) or getattr(ch, "rate_limit_per_user", 0) or 0),
+        "bitrate": getattr(ch, "bitrate", None),
+        "user_limit": getattr(ch, "user_limit", None),
     }
 
-def _role_diff(tgt_like: dict, src_like: dict) -> Tuple[bool, dict]:
-    ch, diff = {}, False
-    for k in ("color", "hoist", "mentionable", "permissions"):
-        if tgt_like.get(k) != src_like.get(k):
-            ch[k] = {"from": tgt_like.get(k), "to": src_like.get(k)}
-            diff = True
-    return diff, ch
-
-# Trimmed, version-tolerant channel change detector (ignores overwrites; perms mirrored later)
-def _chan_changed(tgt, src) -> bool:
-    try:
-        if tgt.type != src.type:
-            return True
-        def parent_name(c):
-            return c.category.name if getattr(c, "category", None) else None
-        def slowmode(c):
-            return getattr(c, "slowmode_delay", 0) or getattr(c, "rate_limit_per_user", 0) or 0
-        cur = {
-            "parent": parent_name(tgt),
-            "topic": (getattr(tgt, "topic", None) or ""),
-            "nsfw": bool(getattr(tgt, "nsfw", False)),
-            "slow": int(slowmode(tgt)),
-        }
-        des = {
-            "parent": parent_name(src),
-            "topic": (getattr(src, "topic", None) or ""),
-            "nsfw": bool(getattr(src, "nsfw", False)),
-            "slow": int(slowmode(src)),
-        }
-        return cur != des
-    except Exception:
-        return True
-
 # Compute desired role overwrites from source to target (roles only); return None if no change
 def _diff_overwrites_roles(src_overwrites, tgt_overwrites, role_map) -> Optional[Dict[discord.Role, discord.PermissionOverwrite]]:
     def to_pair(po: discord.PermissionOverwrite):
@@ -89,29 +131,59 @@ def _diff_overwrites_roles(src_overwrites, tgt_overwrites, role_map) -> Optional
         tgt_role = role_map.get(obj.id)
         if not tgt_role:
             continue
+        # pair() already hands back fresh Permissions objects
         a, d = po.pair()
-        want[tgt_role] = discord.PermissionOverwrite.from_pair(discord.Permissions(a.value), discord.Permissions(d.value))
-    for role, desired_po in want.items():
-        current_po = tgt_overwrites.get(role)
-        if current_po is None or to_pair(current_po) != to_pair(desired_po):
-            changed = True
-            break
+        want[tgt_role] = discord.PermissionOverwrite.from_pair(a, d)
+        if not changed:
+            current_po = tgt_overwrites.get(tgt_role)
+            changed = current_po is None or to_pair(current_po) != (a.value, d.value)
     src_role_targets = set(want.keys())
     tgt_role_targets = {r for r in tgt_overwrites if isinstance(r, discord.Role)}
     if tgt_role_targets - src_role_targets:
         changed = True
     return want if changed else None
 
+# First `limit` warnings as embed bullets (no list copy), plus a "+N more" tail
+def _notes_preview(warnings: List[str], limit: int) -> str:
+    preview = "\n".join(f"• {w}" for w in islice(warnings, limit))
+    if len(warnings) > limit:
+        preview += f"\n… +{len(warnings) - limit} more"
+    return preview
+
+# Rate-limit headers off a failed request (None when absent)
+def _rl_header(e: discord.HTTPException, name: str) -> Optional[str]:
+    headers = getattr(getattr(e, "response", None), "headers", None)
+    return headers.get(name) if headers else None
+
+def _retry_after(e: discord.HTTPException) -> float:
+    for name in ("Retry-After", "X-RateLimit-Reset-After"):
+        try:
+            return float(_rl_header(e, name))
+        except (TypeError, ValueError):
+            continue
+    return 1.0
+
+async def _gather_all(coros):
+    """Run coros concurrently; once every one has settled, re-raise the first failure (keeps fail-fast + rollback)."""
+    results = await asyncio.gather(*coros, return_exceptions=True)
+    for r in results:
+        if isinstance(r, BaseException):
+            raise r
+    return results
+
 # ---------- plan / changelog ----------
-@dataclass
+# slotted dataclasses where supported (3.10+): plans can hold one action per role/channel
+_DC_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DC_SLOTS)
 class RoleAction:
     kind: str  # create|update
     name: str
     id: Optional[int] = None
-    data: Optional[dict] = None
+    data: Optional[RoleSnap] = None
     changes: Optional[dict] = None
 
-@dataclass
+@dataclass(**_DC_SLOTS)
 class ChannelAction:
     kind: str  # category|channel
     op: str    # create|update
@@ -121,7 +193,7 @@ class ChannelAction:
     parent_name: Optional[str] = None
     what: Optional[str] = None
 
-@dataclass
+@dataclass(**_DC_SLOTS)
 class Plan:
     key: str
     source: discord.Guild
@@ -139,11 +211,15 @@ class Plan:
     cat_id_map: Dict[int, int] = field(default_factory=dict)
     chan_id_map: Dict[int, int] = field(default_factory=dict)
     warnings: List[str] = field(default_factory=list)
+    # planned action totals (role_create/role_update/chan_create/chan_update), filled once by _build_plan
+    counts: Dict[str, int] = field(default_factory=dict)
     control_msg: Optional[discord.Message] = None
+    # lockdown state: channel id -> @everyone overwrite (allow, deny) before locking
+    lock_snapshot: Dict[int, Tuple[int, int]] = field(default_factory=dict)
 
-@dataclass
+@dataclass(**_DC_SLOTS)
 class ChangeLogEntry:
-    kind: str               # role|channel|overwrites|roles_reorder|lockdown
+    kind: str               # role|channel|roles_reorder|channels_reorder|lockdown
     op: str                 # create|update|reorder|set
     payload: Dict[str, Any]
 
@@ -175,7 +251,13 @@ class RevampSync(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.pending: Dict[str, Plan] = {}
-        self.rate_delay = 0.20
+        # pending plans are dropped after this many seconds (matches the panel views' timeout)
+        self.plan_ttl = 900.0
+        self._expiry: Dict[str, asyncio.TimerHandle] = {}
+        # rate-limit bucket -> monotonic time it frees up (only set after a 429)
+        self._bucket_next: Dict[str, float] = {}
+        # caps concurrent mutating requests from an apply; the buckets themselves still gate each route
+        self._sema = asyncio.Semaphore(4)
         self.progress_min_secs = 5.0
         # rollback storage: last changelog per target guild id
         self.last_applied: Dict[int, List[ChangeLogEntry]] = {}
@@ -185,6 +267,42 @@ class RevampSync(commands.Cog):
         # behavior switches
         self.fail_fast = True  # any op failure => rollback
 
+    def cog_unload(self):
+        for handle in self._expiry.values():
+            handle.cancel()
+        self._expiry.clear()
+
+    # ---------- plan lifetime ----------
+    def _arm_expiry(self, key: str):
+        """(Re)start the expiry timer for a pending plan."""
+        self._disarm_expiry(key)
+        self._expiry[key] = asyncio.get_running_loop().call_later(self.plan_ttl, self._expire, key)
+
+    def _disarm_expiry(self, key: str):
+        handle = self._expiry.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+
+    def _drop_plan(self, key: str) -> Optional[Plan]:
+        """Forget a pending plan and everything tracked for it."""
+        self._disarm_expiry(key)
+        self.recent_ops.pop(key, None)
+        self.skipped.pop(key, None)
+        return self.pending.pop(key, None)
+
+    def _expire(self, key: str):
+        self._expiry.pop(key, None)
+        plan = self._drop_plan(key)
+        if plan and plan.control_msg:
+            asyncio.create_task(self._mark_expired(plan.control_msg))
+
+    @staticmethod
+    async def _mark_expired(msg: discord.Message):
+        try:
+            await msg.edit(embed=discord.Embed(title="⌛ Revamp — Expired", color=discord.Color.dark_grey()), view=None)
+        except Exception:
+            pass
+
     # ---------- UI helpers ----------
     def _push_recent(self, p: Plan, text: str):
         q = self.recent_ops.setdefault(p.key, [])
@@ -193,10 +311,9 @@ class RevampSync(commands.Cog):
             q.pop(0)
 
     def _panel_embed(self, p: Plan, step: str = "Ready", note: Optional[str] = None) -> discord.Embed:
-        rc = sum(1 for a in p.role_actions if a.kind == "create")
-        ru = sum(1 for a in p.role_actions if a.kind == "update")
-        cc = sum(1 for c in p.channel_actions if c.op == "create")
-        cu = sum(1 for c in p.channel_actions if c.op == "update")
+        counts = p.counts
+        rc, ru = counts.get("role_create", 0), counts.get("role_update", 0)
+        cc, cu = counts.get("chan_create", 0), counts.get("chan_update", 0)
 
         emb = discord.Embed(
             title="✨ Revamp Mirror Panel",
@@ -235,9 +352,7 @@ class RevampSync(commands.Cog):
             emb.add_field(name="Hint", value=note, inline=False)
 
         if p.warnings:
-            preview = "\n".join(f"• {w}" for w in p.warnings[:5])
-            if len(p.warnings) > 5: preview += f"\n… +{len(p.warnings)-5} more"
-            emb.add_field(name="Notes", value=preview, inline=False)
+            emb.add_field(name="Notes", value=_notes_preview(p.warnings, 5), inline=False)
 
         footer = f"ADMIN is never moved • Requested by {p.requested_by}"
         try:
@@ -250,7 +365,7 @@ class RevampSync(commands.Cog):
     def _progress_embed(self, p: Plan, results: dict, step: str) -> discord.Embed:
         emb = self._panel_embed(p, step)
         done = sum(results.values())
-        target = max(done, len(p.role_actions) + len(p.channel_actions))
+        target = max(done, sum(p.counts.values()))
         slots = 16
         filled = int((done / target) * slots) if target else 0
         bar = "█" * filled + "░" * (slots - filled)
@@ -297,6 +412,7 @@ class RevampSync(commands.Cog):
             auto_rollback=True,
         )
         self.pending[plan.key] = plan
+        self._arm_expiry(plan.key)
 
         view = ControlView(self, plan_key=plan.key)
         emb = self._panel_embed(plan, step="Ready", note="Pick a target server, then **Apply**.")
@@ -304,9 +420,22 @@ class RevampSync(commands.Cog):
         plan.control_msg = msg
 
     # ---------- core helpers ----------
+    @staticmethod
+    def _snapshot(guild: discord.Guild) -> Tuple[List[discord.Role], List[discord.abc.GuildChannel]]:
+        """Roles and channels from the gateway cache (kept current by discord.py, no HTTP round-trip)."""
+        return list(guild.roles), list(guild.channels)
+
+    @staticmethod
+    def _split_channels(chans) -> Tuple[List[discord.CategoryChannel], List[discord.abc.GuildChannel]]:
+        """One pass: (categories, everything else)."""
+        cats, non = [], []
+        for c in chans:
+            (cats if isinstance(c, discord.CategoryChannel) else non).append(c)
+        return cats, non
+
     async def _is_empty_guild(self, g: discord.Guild) -> bool:
-        roles = [r for r in await g.fetch_roles() if not r.managed and r.id != g.default_role.id]
-        chans = await g.fetch_channels()
+        roles, chans = self._snapshot(g)
+        roles = [r for r in roles if not r.managed and r.id != g.default_role.id]
         cats = [c for c in chans if isinstance(c, discord.CategoryChannel)]
         noncats = [c for c in chans if not isinstance(c, discord.CategoryChannel)]
         return (len(roles) == 0) and (len(cats) == 0) and (len(noncats) == 0)
@@ -326,32 +455,46 @@ class RevampSync(commands.Cog):
                     mode="sync", mirror_overwrites=True, auto_rollback=True)
 
         # roles
-        src_roles = {r.id: r for r in (await source.fetch_roles())}
-        tgt_roles = {r.id: r for r in (await target.fetch_roles())}
+        src_role_list, src_all = self._snapshot(source)
+        tgt_role_list, tgt_all = self._snapshot(target)
+        src_roles = {r.id: r for r in src_role_list}
+        tgt_roles = {r.id: r for r in tgt_role_list}
         tgt_by_name = {_norm(r.name): r for r in tgt_roles.values() if not r.managed}
 
+        # normalised key -> first source name seen, to flag names that collapse together
+        seen_roles: Dict[str, str] = {}
         for r in sorted(src_roles.values(), key=lambda x: x.position):
             if r.id == source.default_role.id or r.managed:
                 continue
-            t = tgt_by_name.get(_norm(r.name))
+            rkey = _norm(r.name)
+            if rkey in seen_roles:
+                plan.warnings.append(f"Source roles {seen_roles[rkey]!r} and {r.name!r} look the same; both map to one target role.")
+            else:
+                seen_roles[rkey] = r.name
+            t = tgt_by_name.get(rkey)
             if not t:
                 plan.role_actions.append(RoleAction("create", r.name, data=_strip_role(r)))
             else:
-                diff, ch = _role_diff(_strip_role(t), _strip_role(r))
+                diff, ch = _role_diff(t, r)
                 if diff:
                     plan.role_actions.append(RoleAction("update", r.name, id=t.id, changes=ch))
                 plan.role_id_map[r.id] = t.id
 
         # channels
-        src_all = await source.fetch_channels(); tgt_all = await target.fetch_channels()
-        src_cats = [c for c in src_all if isinstance(c, discord.CategoryChannel)]
+        src_cats, src_non = self._split_channels(src_all)
+        tgt_cats, tgt_non = self._split_channels(tgt_all)
         if CATEGORY_SCOPE:
             src_cats = [c for c in src_cats if c.name in CATEGORY_SCOPE]
-        tgt_cats = [c for c in tgt_all if isinstance(c, discord.CategoryChannel)]
-        tgt_cat_by = {c.name: c for c in tgt_cats}
+        tgt_cat_by = {_norm(c.name): c for c in tgt_cats}
 
+        seen_cats: Dict[str, str] = {}
         for c in sorted(src_cats, key=lambda c: c.position):
-            ex = tgt_cat_by.get(c.name)
+            ckey = _norm(c.name)
+            if ckey in seen_cats:
+                plan.warnings.append(f"Source categories {seen_cats[ckey]!r} and {c.name!r} look the same; both map to one target category.")
+            else:
+                seen_cats[ckey] = c.name
+            ex = tgt_cat_by.get(ckey)
             if not ex:
                 plan.channel_actions.append(ChannelAction("category", "create", name=c.name))
             else:
@@ -359,27 +502,29 @@ class RevampSync(commands.Cog):
                 if ex.position != c.position:
                     plan.channel_actions.append(ChannelAction("category", "update", id=ex.id, name=c.name, what="position"))
 
-        def key_of(ch):
-            parent = ch.category.name if ch.category else "__ROOT__"
-            return f"{parent}|{ch.type}|{ch.name}"
-
-        tgt_non = [c for c in tgt_all if not isinstance(c, discord.CategoryChannel)]
-        tgt_by_key = {key_of(c): c for c in tgt_non}
-        src_non = [c for c in src_all if not isinstance(c, discord.CategoryChannel)]
+        tgt_by_key = _chan_index(tgt_non)
         src_non = [c for c in src_non if self._in_scope(c)]
 
         for s in sorted(src_non, key=lambda c: c.position):
-            k = key_of(s)
-            ex = tgt_by_key.get(k)
+            cat = s.category
+            parent = cat.name if cat else None
+            ex = tgt_by_key.get(_chan_key(s))
             if not ex:
                 plan.channel_actions.append(ChannelAction("channel", "create", name=s.name, type=s.type,
-                                                          parent_name=(s.category.name if s.category else None)))
+                                                          parent_name=parent))
             else:
                 plan.chan_id_map[s.id] = ex.id
-                if _chan_changed(ex, s):
+                if _chan_sig(ex) != _chan_sig(s):
                     plan.channel_actions.append(ChannelAction("channel", "update", id=ex.id, name=s.name, type=s.type,
-                                                              parent_name=(s.category.name if s.category else None),
-                                                              what="config/position"))
+                                                              parent_name=parent, what="config/position"))
+
+        # tally once here; every panel/progress edit reads these instead of rescanning the actions
+        counts = dict.fromkeys(("role_create", "role_update", "chan_create", "chan_update"), 0)
+        for a in plan.role_actions:
+            counts[f"role_{a.kind}"] += 1
+        for c in plan.channel_actions:
+            counts[f"chan_{c.op}"] += 1
+        plan.counts = counts
         return plan
 
     # ---------- ADMIN anchor (never moved) ----------
@@ -392,7 +537,7 @@ class RevampSync(commands.Cog):
         me = guild.me
         if not me:
             raise RuntimeError("Bot member not found in target guild.")
-        candidates = [r for r in guild.roles if not r.managed and _norm(r.name) == _norm(ADMIN_ANCHOR_NAME)]
+        candidates = [r for r in guild.roles if not r.managed and _norm(r.name) == _ADMIN_ANCHOR_KEY]
         if candidates:
             admin_role = max(candidates, key=lambda r: r.position)
         else:
@@ -404,11 +549,9 @@ class RevampSync(commands.Cog):
                 mentionable=False,
                 reason="Revamp sync: create ADMIN anchor role",
             )
-            await asyncio.sleep(self.rate_delay)
         if admin_role not in me.roles:
             try:
                 await me.add_roles(admin_role, reason="Revamp sync: grant ADMIN anchor to bot")
-                await asyncio.sleep(self.rate_delay)
             except discord.Forbidden:
                 raise RuntimeError("Missing permissions to assign ADMIN anchor to the bot.")
         top_pos = len(guild.roles) - 1
@@ -421,38 +564,74 @@ class RevampSync(commands.Cog):
     # ---------- apply (fail-fast + auto-rollback) ----------
     async def apply_plan(self, p: Plan) -> discord.Embed:
         s, t = p.source, p.target
+        # one cache snapshot per guild for the whole apply; what we create is tracked as we go
+        src_roles, src_all = self._snapshot(s)
+        _, tgt_all = self._snapshot(t)
+        # split once; the category and channel phases below both work from these
+        src_cats, src_non = self._split_channels(src_all)
+        tgt_cats, tgt_non = self._split_channels(tgt_all)
+        if CATEGORY_SCOPE:
+            src_cats = [c for c in src_cats if c.name in CATEGORY_SCOPE]
+        src_non = [c for c in src_non if self._in_scope(c)]
+        created_roles: List[discord.Role] = []
+        created_cats: Dict[int, discord.CategoryChannel] = {}
         results = {"role_create": 0, "role_update": 0, "chan_create": 0, "chan_update": 0}
         changelog: List[ChangeLogEntry] = []
         self.last_applied[t.id] = changelog  # expose live changelog for rollback
         self.recent_ops[p.key] = []
         self.skipped[p.key] = 0
 
-        last_edit = time.monotonic()
-        async def progress(step_text: str):
-            nonlocal last_edit
-            now = time.monotonic()
-            if (now - last_edit) >= self.progress_min_secs:
-                if p.control_msg:
-                    try: await p.control_msg.edit(embed=self._progress_embed(p, results, step_text))
-                    except Exception: pass
-                last_edit = now
-
-        async def do(coro, note: str):
+        # the work loop only records its step; a side task renders it at most every progress_min_secs,
+        # so no mutation ever waits on a message edit
+        step = "Starting"
+        def progress(step_text: str):
+            nonlocal step
+            step = step_text
+
+        async def progress_loop():
+            shown = None
+            while True:
+                await asyncio.sleep(self.progress_min_secs)
+                state = (step, *results.values(), *self.recent_ops.get(p.key, ()))
+                if state == shown:
+                    continue
+                shown = state
+                try: await p.control_msg.edit(embed=self._progress_embed(p, results, step))
+                except Exception: pass
+
+        progress_task = asyncio.create_task(progress_loop()) if p.control_msg else None
+        reorder_task: Optional[asyncio.Task] = None
+
+        async def do(factory, note: str):
+            # factory is a zero-arg callable returning a fresh coroutine, so a retry re-issues the request
             retries, delay = 3, 0.8
             while True:
                 try:
-                    out = await coro
-                    await asyncio.sleep(self.rate_delay)
-                    return out
+                    async with self._sema:
+                        return await factory()
+                except discord.NotFound as e:
+                    # the object went away mid-apply; nothing to retry, callers treat None as skipped
+                    p.warnings.append(f"{note}: Not found ({e})")
+                    return None
                 except discord.Forbidden as e:
+                    # every later call would be refused too: abort (and roll back)
                     p.warnings.append(f"{note}: Forbidden ({e})");
                     raise
                 except discord.HTTPException as e:
-                    if retries <= 0:
+                    # only rate limits and server errors are worth re-sending; other 4xx fail the same way again
+                    if retries <= 0 or not (e.status == 429 or e.status >= 500):
                         p.warnings.append(f"{note}: {e}")
                         raise
-                    await asyncio.sleep(delay); retries -= 1; delay = min(delay * 2, 4.0)
-                except Exception as e:
+                    retries -= 1
+                    if e.status == 429:
+                        # wait out the bucket Discord named; concurrent callers on it share the deadline
+                        bucket = _rl_header(e, "X-RateLimit-Bucket") or note
+                        until = max(self._bucket_next.get(bucket, 0.0), time.monotonic() + _retry_after(e))
+                        self._bucket_next[bucket] = until
+                        await asyncio.sleep(until - time.monotonic() + 0.05)
+                    else:
+                        await asyncio.sleep(delay); delay = min(delay * 2, 4.0)
+                except (discord.DiscordException, OSError, asyncio.TimeoutError) as e:
                     p.warnings.append(f"{note}: {e}")
                     raise
 
@@ -464,215 +643,220 @@ class RevampSync(commands.Cog):
 
             # optional lockdown
             if p.lockdown:
-                snapshot = await self._snapshot_lockdown(t)
-                changelog.append(ChangeLogEntry("lockdown", "set", {"snapshot": snapshot}))
                 await self._toggle_lock(t, enable=True, plan=p)
-                await progress("Locked")
+                changelog.append(ChangeLogEntry("lockdown", "set", {"snapshot": p.lock_snapshot}))
+                progress("Locked")
 
             # ADMIN role (never moved)
             await self._ensure_admin_anchor(p)
             bot_top = self._bot_top_position(t)
 
             # ---- roles ----
-            for a in p.role_actions:
-                if a.kind == "create" and a.data:
-                    created = await do(t.create_role(
-                        name=a.data["name"], colour=discord.Colour(a.data["color"]), hoist=a.data["hoist"],
-                        mentionable=a.data["mentionable"], permissions=discord.Permissions(a.data["permissions"]),
-                        reason="Revamp sync: create role"
-                    ), f"Create role {a.data.get('name')}")
-                    if created:
-                        changelog.append(ChangeLogEntry("role", "create", {"role_id": created.id}))
-                        try:
-                            if created.position != 1:
-                                await created.edit(position=1, reason="Revamp sync: seed under ADMIN")
-                                await asyncio.sleep(self.rate_delay)
-                        except Exception:
-                            pass
-                        results["role_create"] += 1
-                        self._push_recent(p, f"Role + {created.name}")
-                        await progress("Roles")
-
-                elif a.kind == "update" and a.id and a.changes:
-                    tgt = t.get_role(a.id)
-                    if not tgt:
-                        continue
-                    if tgt.position >= bot_top:
-                        p.warnings.append(f"Skip update for {tgt.name!r}: at/above bot's highest role (pos {tgt.position} ≥ {bot_top})")
-                        self.skipped[p.key] = self.skipped.get(p.key, 0) + 1
-                        continue
-                    pre = {
-                        "id": tgt.id, "color": tgt.colour.value, "hoist": tgt.hoist,
-                        "mentionable": tgt.mentionable, "permissions": tgt.permissions.value
-                    }
-                    kwargs = {}
-                    if "color" in a.changes:
-                        newcol = a.changes["color"]["to"]
-                        if tgt.colour.value != newcol:
-                            kwargs["colour"] = discord.Colour(newcol)
-                    if "hoist" in a.changes and tgt.hoist != a.changes["hoist"]["to"]:
-                        kwargs["hoist"] = a.changes["hoist"]["to"]
-                    if "mentionable" in a.changes and tgt.mentionable != a.changes["mentionable"]["to"]:
-                        kwargs["mentionable"] = a.changes["mentionable"]["to"]
-                    if "permissions" in a.changes and tgt.permissions.value != a.changes["permissions"]["to"]:
-                        kwargs["permissions"] = discord.Permissions(a.changes["permissions"]["to"])
-                    if kwargs:
-                        await do(tgt.edit(reason="Revamp sync: update role", **kwargs), f"Update role {tgt.name}")
-                        changelog.append(ChangeLogEntry("role", "update", {"pre": pre}))
-                        results["role_update"] += 1
-                        self._push_recent(p, f"Role ~ {tgt.name}")
-                        await progress("Roles")
+            # creates/updates touch different roles, so run them concurrently (do() bounds in-flight requests)
+            async def create_role(a: RoleAction):
+                created = await do(lambda: t.create_role(
+                    name=a.data.name, colour=discord.Colour(a.data.color), hoist=a.data.hoist,
+                    mentionable=a.data.mentionable, permissions=discord.Permissions(a.data.permissions),
+                    reason="Revamp sync: create role"
+                ), f"Create role {a.data.name}")
+                if created:
+                    created_roles.append(created)
+                    changelog.append(ChangeLogEntry("role", "create", {"role_id": created.id}))
+                    results["role_create"] += 1
+                    self._push_recent(p, f"Role + {created.name}")
+                    progress("Roles")
+
+            async def update_role(a: RoleAction):
+                tgt = t.get_role(a.id)
+                if not tgt:
+                    return
+                if tgt.position >= bot_top:
+                    p.warnings.append(f"Skip update for {tgt.name!r}: at/above bot's highest role (pos {tgt.position} ≥ {bot_top})")
+                    self.skipped[p.key] = self.skipped.get(p.key, 0) + 1
+                    return
+                pre = {
+                    "id": tgt.id, "color": tgt.colour.value, "hoist": tgt.hoist,
+                    "mentionable": tgt.mentionable, "permissions": tgt.permissions.value
+                }
+                kwargs = _role_patch(a.changes, tgt)
+                if kwargs:
+                    await do(lambda: tgt.edit(reason="Revamp sync: update role", **kwargs), f"Update role {tgt.name}")
+                    changelog.append(ChangeLogEntry("role", "update", {"pre": pre}))
+                    results["role_update"] += 1
+                    self._push_recent(p, f"Role ~ {tgt.name}")
+                    progress("Roles")
+
+            await _gather_all(
+                create_role(a) if a.kind == "create" else update_role(a)
+                for a in p.role_actions
+                if (a.kind == "create" and a.data) or (a.kind == "update" and a.id and a.changes)
+            )
 
             # refresh mapping
-            fresh = await t.fetch_roles()
-            by_name = {_norm(r.name): r for r in fresh if not r.managed}
-            for sr in (await s.fetch_roles()):
+            # created roles may not have reached the cache through the gateway yet
+            by_name = {_norm(r.name): r for r in [*t.roles, *created_roles] if not r.managed}
+            for sr in src_roles:
                 if sr.id == s.default_role.id or sr.managed:
                     continue
                 tr = by_name.get(_norm(sr.name))
                 if tr:
                     p.role_id_map[sr.id] = tr.id
 
-            # reorder roles under ADMIN (snapshot positions for rollback)
-            try:
-                pos_snapshot = {r.id: r.position for r in t.roles}
-                await self._reorder_roles_like_source(p)
-                changelog.append(ChangeLogEntry("roles_reorder", "reorder", {"positions": pos_snapshot}))
-                await progress("Roles")
-            except Exception as e:
-                p.warnings.append(f"Role reordering issue: {e}")
+            # reorder roles under ADMIN (snapshot positions for rollback). Only roles move here, so it
+            # runs alongside the category/channel phase and is awaited before threads.
+            async def reorder_roles():
+                try:
+                    pos_snapshot = {r.id: r.position for r in t.roles}
+                    await self._reorder_roles_like_source(p, src_roles)
+                    changelog.append(ChangeLogEntry("roles_reorder", "reorder", {"positions": pos_snapshot}))
+                    progress("Roles")
+                except Exception as e:
+                    p.warnings.append(f"Role reordering issue: {e}")
+
+            reorder_task = asyncio.create_task(reorder_roles())
+
+            # existing category/channel id -> (current position, source position), applied in one batch below
+            moves: Dict[int, Tuple[int, int]] = {}
 
             # ensure categories exist/order
-            src_cats = [c for c in await s.fetch_channels() if isinstance(c, discord.CategoryChannel)]
-            if CATEGORY_SCOPE:
-                src_cats = [c for c in src_cats if c.name in CATEGORY_SCOPE]
-            tgt_cats = [c for c in await t.fetch_channels() if isinstance(c, discord.CategoryChannel)]
-            by_name_cat = {c.name: c for c in tgt_cats}
+            by_name_cat = {_norm(c.name): c for c in tgt_cats}
             for cat in sorted(src_cats, key=lambda c: c.position):
-                ex = by_name_cat.get(cat.name)
+                ex = by_name_cat.get(_norm(cat.name))
                 if not ex:
-                    created = await do(t.create_category(name=cat.name, reason="Revamp sync: create category"), f"Create category {cat.name}")
+                    created = await do(lambda: t.create_category(name=cat.name, reason="Revamp sync: create category"), f"Create category {cat.name}")
                     if created:
                         changelog.append(ChangeLogEntry("channel", "create", {"id": created.id}))
                         p.cat_id_map[cat.id] = created.id
+                        created_cats[created.id] = created
                         results["chan_create"] += 1
                         self._push_recent(p, f"Cat + {cat.name}")
-                        await progress("Categories")
+                        progress("Categories")
                 else:
                     p.cat_id_map[cat.id] = ex.id
                     if ex.position != cat.position:
-                        prepos = ex.position
-                        await do(ex.edit(position=cat.position, reason="Revamp sync: reorder category"), f"Reorder category {ex.name}")
-                        changelog.append(ChangeLogEntry("channel", "update", {"id": ex.id, "pre": {"position": prepos}}))
-                        self._push_recent(p, f"Cat ↕ {ex.name}")
-                        await progress("Categories")
+                        moves[ex.id] = (ex.position, cat.position)
 
             # create/update non-category channels + diffs
-            src_non = [c for c in await s.fetch_channels() if not isinstance(c, discord.CategoryChannel)]
-            src_non = [c for c in src_non if self._in_scope(c)]
-            tgt_non = [c for c in await t.fetch_channels() if not isinstance(c, discord.CategoryChannel)]
-
-            def find_match(src):
-                for c in tgt_non:
-                    if c.name == src.name and c.type == src.type and ((c.category.name if c.category else None) == (src.category.name if src.category else None)):
-                        return c
-
-            created_map = {}
+            tgt_index = _chan_index(tgt_non)
+
+            # role overwrites (roles only) — ALWAYS mirrored, sent with the create/update itself
+            role_map_full: Dict[int, discord.Role] = {sid: r for sid, tid in p.role_id_map.items() if (r := t.get_role(tid))}
+
+            async def create_channel(src_ch, parent_obj):
+                ch = None
+                ow = _diff_overwrites_roles(src_ch.overwrites, {}, role_map_full) or {}
+                if src_ch.type is discord.ChannelType.text:
+                    f = _chan_fields(src_ch)
+                    ch = await do(lambda: t.create_text_channel(
+                        name=src_ch.name, category=parent_obj, overwrites=ow,
+                        topic=f["topic"], nsfw=f["nsfw"], slowmode_delay=f["slowmode"],
+                        reason="Revamp sync: create channel"
+                    ), f"Create channel #{src_ch.name}")
+                elif src_ch.type in (discord.ChannelType.voice, discord.ChannelType.stage_voice):
+                    f = _chan_fields(src_ch)
+                    ch = await do(lambda: t.create_voice_channel(
+                        name=src_ch.name, category=parent_obj, overwrites=ow,
+                        bitrate=f["bitrate"], user_limit=f["user_limit"],
+                        reason="Revamp sync: create channel"
+                    ), f"Create channel #{src_ch.name}")
+                elif src_ch.type is discord.ChannelType.forum:
+                    ch = await do(lambda: t.create_forum(
+                        name=src_ch.name, category=parent_obj, overwrites=ow,
+                        reason="Revamp sync: create forum"
+                    ), f"Create forum #{src_ch.name}")
+                else:
+                    ch = await do(lambda: t.create_text_channel(name=src_ch.name, category=parent_obj, overwrites=ow,
+                                                        reason="Revamp sync: create channel"), f"Create channel #{src_ch.name}")
+                if ch:
+                    changelog.append(ChangeLogEntry("channel", "create", {"id": ch.id}))
+                    created_map[src_ch.id] = ch
+                    results["chan_create"] += 1
+                    self._push_recent(p, f"Chan + #{src_ch.name}")
+                    progress("Channels")
+
+            async def create_group(group):
+                # channels sharing a parent are created in source order so they land in that order
+                for src_ch, parent_obj in group:
+                    await create_channel(src_ch, parent_obj)
+
+            async def update_channel(src_ch, ex, parent_obj):
+                # revalidated against the live channel: only fields that still differ are sent
+                edit_payload = {}
+                want, have = _chan_fields(src_ch), _chan_fields(ex)
+                if ex.category_id != (parent_obj.id if parent_obj else None):
+                    edit_payload["category"] = parent_obj
+                if hasattr(ex, "topic") and (have["topic"] or None) != (want["topic"] or None):
+                    edit_payload["topic"] = want["topic"]
+                if hasattr(ex, "nsfw") and have["nsfw"] != want["nsfw"]:
+                    edit_payload["nsfw"] = want["nsfw"]
+                if hasattr(ex, "slowmode_delay") and have["slowmode"] != want["slowmode"]:
+                    edit_payload["slowmode_delay"] = want["slowmode"]
+                desired_ow = _diff_overwrites_roles(src_ch.overwrites, ex.overwrites, role_map_full)
+                if desired_ow is not None:
+                    edit_payload["overwrites"] = desired_ow
+
+                if edit_payload:
+                    # rollback snapshot only for channels we actually touch
+                    pre = await self._snapshot_channel(ex)
+                    await do(lambda: ex.edit(**edit_payload, reason="Revamp sync: update channel"), f"Update channel #{ex.name}")
+                    changelog.append(ChangeLogEntry("channel", "update", {"id": ex.id, "pre": pre}))
+                    results["chan_update"] += 1
+                    self._push_recent(p, f"Chan ~ #{ex.name}")
+                    progress("Channels")
+
+            created_map: Dict[int, discord.abc.GuildChannel] = {}
+            pending_updates = []
+            pending_creates: Dict[Optional[int], List[Tuple[discord.abc.GuildChannel, Optional[discord.CategoryChannel]]]] = {}
+            # source category id -> (normalised name, target parent id, target parent), resolved once per category
+            parents: Dict[Optional[int], Tuple[Optional[str], Optional[int], Optional[discord.CategoryChannel]]] = {None: (None, None, None)}
             for src_ch in sorted(src_non, key=lambda c: c.position):
-                ex = find_match(src_ch)
-                parent_id = p.cat_id_map.get(getattr(src_ch, "category_id", None)) if getattr(src_ch, "category_id", None) else None
-                parent_obj = t.get_channel(parent_id) if parent_id else None
+                cat_id = getattr(src_ch, "category_id", None)
+                if cat_id not in parents:
+                    cat = src_ch.category
+                    parent_id = p.cat_id_map.get(cat_id)
+                    parents[cat_id] = (_norm(cat.name) if cat else None, parent_id,
+                                       (t.get_channel(parent_id) or created_cats.get(parent_id)) if parent_id else None)
+                src_parent, parent_id, parent_obj = parents[cat_id]
+                ex = tgt_index.get((_norm(src_ch.name), src_ch.type, src_parent))
 
                 if not ex:
-                    ch = None
-                    if src_ch.type is discord.ChannelType.text:
-                        ch = await do(t.create_text_channel(
-                            name=src_ch.name, category=parent_obj,
-                            topic=getattr(src_ch, "topic", None), nsfw=getattr(src_ch, "nsfw", False),
-                            slowmode_delay=getattr(src_ch, "slowmode_delay", 0) or getattr(src_ch, "rate_limit_per_user", 0),
-                            reason="Revamp sync: create channel"
-                        ), f"Create channel #{src_ch.name}")
-                    elif src_ch.type in (discord.ChannelType.voice, discord.ChannelType.stage_voice):
-                        ch = await do(t.create_voice_channel(
-                            name=src_ch.name, category=parent_obj,
-                            bitrate=getattr(src_ch, "bitrate", None), user_limit=getattr(src_ch, "user_limit", None),
-                            reason="Revamp sync: create channel"
-                        ), f"Create channel #{src_ch.name}")
-                    elif src_ch.type is discord.ChannelType.forum:
-                        ch = await do(t.create_forum(
-                            name=src_ch.name, category=parent_obj,
-                            reason="Revamp sync: create forum"
-                        ), f"Create forum #{src_ch.name}")
-                    else:
-                        ch = await do(t.create_text_channel(name=src_ch.name, category=parent_obj,
-                                                            reason="Revamp sync: create channel"), f"Create channel #{src_ch.name}")
-                    if ch:
-                        changelog.append(ChangeLogEntry("channel", "create", {"id": ch.id}))
-                        created_map[src_ch.id] = ch
-                        results["chan_create"] += 1
-                        self._push_recent(p, f"Chan + #{src_ch.name}")
-                        await progress("Channels")
+                    pending_creates.setdefault(parent_id, []).append((src_ch, parent_obj))
                 else:
-                    pre = await self._snapshot_channel(ex)
-                    kwargs = {"reason": "Revamp sync: update channel"}
-                    if hasattr(ex, "category"):
-                        if (ex.category.id if ex.category else None) != (parent_obj.id if parent_obj else None):
-                            kwargs["category"] = parent_obj
-                    if hasattr(ex, "topic"):
-                        src_topic = getattr(src_ch, "topic", None)
-                        if (ex.topic or None) != (src_topic or None):
-                            kwargs["topic"] = src_topic
-                    if hasattr(ex, "nsfw"):
-                        src_nsfw = bool(getattr(src_ch, "nsfw", False))
-                        if bool(getattr(ex, "nsfw", False)) != src_nsfw:
-                            kwargs["nsfw"] = src_nsfw
-                    if hasattr(ex, "slowmode_delay"):
-                        src_sd = getattr(src_ch, "slowmode_delay", 0) or getattr(src_ch, "rate_limit_per_user", 0)
-                        if int(getattr(ex, "slowmode_delay", 0) or getattr(ex, "rate_limit_per_user", 0)) != int(src_sd or 0):
-                            kwargs["slowmode_delay"] = src_sd
-
-                    edit_payload = {k: v for k, v in kwargs.items() if k != "reason"}
-                    if any(k for k in edit_payload):
-                        await do(ex.edit(**edit_payload, reason=kwargs.get("reason")), f"Update channel #{ex.name}")
-                        changelog.append(ChangeLogEntry("channel", "update", {"id": ex.id, "pre": pre}))
-                        results["chan_update"] += 1
-                        self._push_recent(p, f"Chan ~ #{ex.name}")
-                        await progress("Channels")
+                    pending_updates.append(update_channel(src_ch, ex, parent_obj))
 
                     if getattr(ex, "position", None) is not None and ex.position != src_ch.position:
-                        prepos = ex.position
-                        await do(ex.edit(position=src_ch.position, reason="Revamp sync: reorder channel"), f"Reorder channel #{ex.name}")
-                        changelog.append(ChangeLogEntry("channel", "update", {"id": ex.id, "pre": {"position": prepos}}))
-                        self._push_recent(p, f"Chan ↕ #{ex.name}")
-                        await progress("Channels")
+                        moves[ex.id] = (ex.position, src_ch.position)
 
-                    p.chan_id_map[src_ch.id] = ex.id
                     created_map[src_ch.id] = ex
 
-            # overwrites (roles only) — ALWAYS mirror
-            role_map_full: Dict[int, discord.Role] = {sid: t.get_role(tid) for sid, tid in p.role_id_map.items() if t.get_role(tid)}
-            for src_ch in src_non:
-                tgt_ch = created_map.get(src_ch.id)
-                if not tgt_ch:
-                    continue
-                desired = _diff_overwrites_roles(src_ch.overwrites, tgt_ch.overwrites, role_map_full)
-                if desired is not None:
-                    pre_ov = await self._snapshot_role_overwrites(tgt_ch)
-                    await do(tgt_ch.edit(overwrites=desired, reason="Revamp sync: mirror role overwrites"), f"Set overwrites #{tgt_ch.name}")
-                    changelog.append(ChangeLogEntry("overwrites", "set", {"channel_id": tgt_ch.id, "pre": pre_ov}))
-                    results["chan_update"] += 1
-                    self._push_recent(p, f"Perms ↷ #{tgt_ch.name}")
-                    await progress("Permissions")
+            # updates touch distinct channels and different categories don't affect each other's
+            # ordering, so all of it runs concurrently (do() bounds the requests in flight)
+            await _gather_all([*pending_updates, *(create_group(group) for group in pending_creates.values())])
+            # created_map (source id -> matched or created target channel) is the one source of truth;
+            # the id map is derived from it once, so it also covers channels created just now
+            p.chan_id_map = {sid: ch.id for sid, ch in created_map.items()}
+
+            # every category/channel position fix in one bulk PATCH, once the creates have landed
+            if moves:
+                payload = [{"id": cid, "position": new} for cid, (_, new) in moves.items()]
+                await do(lambda: t._state.http.bulk_channel_update(t.id, payload, reason="Revamp sync: reorder channels"),
+                         f"Reorder {len(payload)} channel(s)")
+                changelog.append(ChangeLogEntry("channels_reorder", "reorder", {"positions": {cid: old for cid, (old, _) in moves.items()}}))
+                self._push_recent(p, f"Chan ↕ ×{len(payload)}")
+                progress("Channels")
+
+            await reorder_task
+            reorder_task = None
 
             # threads (optional, default off)
             if p.sync_threads:
                 await self._sync_threads(p, src_non, created_map)
-                await progress("Threads")
+                progress("Threads")
 
             # unlock
             if p.lockdown:
                 await self._toggle_lock(t, enable=False, plan=p)
-                await progress("Unlocked")
+                progress("Unlocked")
 
             # done
             final = discord.Embed(title="✅ Revamp — Completed", color=discord.Color.green())
@@ -681,14 +865,15 @@ class RevampSync(commands.Cog):
             final.add_field(name="👤 Roles", value=f"C **{results['role_create']}** • U **{results['role_update']}**", inline=False)
             final.add_field(name="📺 Channels", value=f"C **{results['chan_create']}** • U **{results['chan_update']}**", inline=False)
             if p.warnings:
-                preview = "\n".join(f"• {w}" for w in p.warnings[:8])
-                if len(p.warnings) > 8: preview += f"\n… +{len(p.warnings)-8} more"
-                final.add_field(name="Notes", value=preview, inline=False)
+                final.add_field(name="Notes", value=_notes_preview(p.warnings, 8), inline=False)
             final.timestamp = discord.utils.utcnow()
             return final
 
         except Exception as e:
             p.warnings.append(f"Fatal error during apply: {e}")
+            if reorder_task:
+                # let an in-flight role reorder land (and log itself) before rolling back
+                await reorder_task
             rollback_embed = None
             try:
                 if p.auto_rollback:
@@ -699,11 +884,12 @@ class RevampSync(commands.Cog):
             err.add_field(name="Error", value=f"```\n{e}\n```", inline=False)
             err.add_field(name="Auto-Rollback", value=("Completed." if rollback_embed else "Attempted but failed — see Notes."), inline=False)
             if p.warnings:
-                preview = "\n".join(f"• {w}" for w in p.warnings[:8])
-                if len(p.warnings) > 8: preview += f"\n… +{len(p.warnings)-8} more"
-                err.add_field(name="Notes", value=preview, inline=False)
+                err.add_field(name="Notes", value=_notes_preview(p.warnings, 8), inline=False)
             err.timestamp = discord.utils.utcnow()
             return err
+        finally:
+            if progress_task:
+                progress_task.cancel()
 
     # ---------- rollback ----------
     async def _rollback(self, target: discord.Guild) -> discord.Embed:
@@ -712,7 +898,7 @@ class RevampSync(commands.Cog):
             return discord.Embed(title=f"{_icon('rollback')} Rollback", description="Nothing to rollback.", color=discord.Color.orange())
 
         reversed_log = list(reversed(log))
-        restored = {"role": 0, "channel": 0, "overwrites": 0, "reorder": 0, "lockdown": 0}
+        restored = {"role": 0, "channel": 0, "reorder": 0, "lockdown": 0}
         for entry in reversed_log:
             try:
                 if entry.kind == "role":
@@ -739,47 +925,31 @@ class RevampSync(commands.Cog):
                     elif entry.op == "update":
                         pre = entry.payload["pre"]; ch = target.get_channel(entry.payload["id"])
                         if ch:
-                            await self._restore_channel_partial(ch, pre); restored["channel"] += 1
-
-                elif entry.kind == "overwrites" and entry.op == "set":
-                    ch = target.get_channel(entry.payload["channel_id"])
-                    pre = entry.payload["pre"]
-                    if ch:
-                        ov = {}
-                        for rid, (a_val, d_val) in pre.items():
-                            role = target.get_role(int(rid))
-                            if role:
-                                ov[role] = discord.PermissionOverwrite.from_pair(
-                                    discord.Permissions(a_val), discord.Permissions(d_val)
-                                )
-                        await ch.edit(overwrites=ov, reason="Revamp rollback: restore role overwrites")
-                        restored["overwrites"] += 1
+                            await self._restore_channel_partial(ch, pre)
+                            restored["channel"] += 1
+
+                elif entry.kind == "channels_reorder" and entry.op == "reorder":
+                    payload = [{"id": int(cid), "position": pos} for cid, pos in entry.payload["positions"].items()
+                               if target.get_channel(int(cid))]
+                    if payload:
+                        await target._state.http.bulk_channel_update(target.id, payload, reason="Revamp rollback: restore channel positions")
+                    restored["reorder"] += 1
 
                 elif entry.kind == "roles_reorder" and entry.op == "reorder":
                     pos = entry.payload["positions"]  # {role_id: position}
+                    # one positions PATCH for every role that moved, not a role.edit each
+                    moved = {}
                     for rid, rpos in pos.items():
                         role = target.get_role(int(rid))
-                        if role:
-                            try: await role.edit(position=rpos, reason="Revamp rollback: restore role positions")
-                            except Exception: pass
+                        if role and role != target.default_role and role.position != rpos:
+                            moved[role] = rpos
+                    if moved:
+                        await target.edit_role_positions(positions=moved, reason="Revamp rollback: restore role positions")
                     restored["reorder"] += 1
 
                 elif entry.kind == "lockdown" and entry.op == "set":
-                    snap = entry.payload["snapshot"]  # {channel_id: (allow,deny)}
-                    everyone = target.default_role
-                    for cid, pair in snap.items():
-                        ch = target.get_channel(int(cid))
-                        if not ch or not isinstance(ch, discord.TextChannel):
-                            continue
-                        a_val, d_val = pair
-                        po = discord.PermissionOverwrite.from_pair(discord.Permissions(a_val), discord.Permissions(d_val))
-                        try:
-                            await ch.set_permissions(everyone, overwrite=po, reason="Revamp rollback: restore lockdown state")
-                        except Exception:
-                            pass
+                    await self._restore_lock_snapshot(target, entry.payload["snapshot"], "Revamp rollback: restore lockdown state")
                     restored["lockdown"] += 1
-
-                await asyncio.sleep(self.rate_delay)
             except Exception:
                 continue
 
@@ -788,22 +958,12 @@ class RevampSync(commands.Cog):
         emb = discord.Embed(title=f"{_icon('rollback')} Rollback — Completed", color=discord.Color.blurple())
         emb.add_field(name="Roles", value=f"{restored['role']} changes reverted", inline=True)
         emb.add_field(name="Channels", value=f"{restored['channel']} changes reverted", inline=True)
-        emb.add_field(name="Overwrites", value=f"{restored['overwrites']} restored", inline=True)
         emb.add_field(name="Positions", value=f"{restored['reorder']} batch", inline=True)
         emb.add_field(name="Lockdown", value=f"{restored['lockdown']} restored", inline=True)
         emb.timestamp = discord.utils.utcnow()
         return emb
 
     # ---------- snapshots / restore helpers ----------
-    async def _snapshot_lockdown(self, guild: discord.Guild) -> Dict[int, Tuple[int, int]]:
-        out = {}
-        everyone = guild.default_role
-        for ch in [c for c in await guild.fetch_channels() if isinstance(c, discord.TextChannel)]:
-            po = ch.overwrites_for(everyone) or discord.PermissionOverwrite()
-            a, d = po.pair()
-            out[ch.id] = (a.value, d.value)
-        return out
-
     async def _snapshot_role_overwrites(self, ch: discord.abc.GuildChannel) -> Dict[int, Tuple[int, int]]:
         out = {}
         for obj, po in getattr(ch, "overwrites", {}).items():
@@ -820,11 +980,7 @@ class RevampSync(commands.Cog):
             "id": ch.id,
             "category": (ch.category.id if getattr(ch, "category", None) else None),
             "position": getattr(ch, "position", 0),
-            "topic": getattr(ch, "topic", None),
-            "nsfw": getattr(ch, "nsfw", False),
-            "slowmode": getattr(ch, "slowmode_delay", 0) or getattr(ch, "rate_limit_per_user", 0),
-            "bitrate": getattr(ch, "bitrate", None),
-            "user_limit": getattr(ch, "user_limit", None),
+            **_chan_fields(ch),
         }
         snap["role_overwrites"] = await self._snapshot_role_overwrites(ch)
         return snap
@@ -848,14 +1004,8 @@ class RevampSync(commands.Cog):
             kwargs["bitrate"] = pre["bitrate"]
         if "user_limit" in pre and hasattr(ch, "user_limit") and getattr(ch, "user_limit", None) != pre["user_limit"]:
             kwargs["user_limit"] = pre["user_limit"]
-        if kwargs:
-            await ch.edit(**kwargs, reason="Revamp rollback: channel revert")
-        if "position" in pre and getattr(ch, "position", None) is not None and ch.position != pre["position"]:
-            try:
-                await ch.edit(position=pre["position"], reason="Revamp rollback: channel position")
-            except Exception:
-                pass
         if "role_overwrites" in pre:
+            # rides along with the field revert: one PATCH per channel instead of two
             ov = {}
             for rid, (a_val, d_val) in pre["role_overwrites"].items():
                 role = ch.guild.get_role(int(rid))
@@ -863,10 +1013,11 @@ class RevampSync(commands.Cog):
                     ov[role] = discord.PermissionOverwrite.from_pair(
                         discord.Permissions(a_val), discord.Permissions(d_val)
                     )
-            try:
-                await ch.edit(overwrites=ov, reason="Revamp rollback: channel overwrites")
-            except Exception:
-                pass
+            kwargs["overwrites"] = ov
+        if "position" in pre and getattr(ch, "position", None) is not None and ch.position != pre["position"]:
+            kwargs["position"] = pre["position"]
+        if kwargs:
+            await ch.edit(**kwargs, reason="Revamp rollback: channel revert")
 
     # ---------- threads helper (optional) ----------
     async def _gather_threads(self, parent) -> List[discord.Thread]:
@@ -893,17 +1044,22 @@ class RevampSync(commands.Cog):
 
     async def _sync_threads(self, p: Plan, src_non: List[discord.abc.GuildChannel], created_map: Dict[int, discord.abc.GuildChannel]):
         t = p.target
+        # (normalised name, type) -> target text/forum channels, built on first miss instead of scanning t.channels each time
+        by_name_type: Optional[Dict[Tuple[str, discord.ChannelType], List[discord.abc.GuildChannel]]] = None
         for src_parent in src_non:
             if not isinstance(src_parent, (discord.TextChannel, discord.ForumChannel)):
                 continue
             tgt_parent = created_map.get(src_parent.id)
             if not tgt_parent:
+                if by_name_type is None:
+                    by_name_type = {}
+                    for c in t.channels:
+                        if isinstance(c, (discord.TextChannel, discord.ForumChannel)):
+                            by_name_type.setdefault((_norm(c.name), c.type), []).append(c)
                 parent_id = p.cat_id_map.get(getattr(src_parent, "category_id", None)) if getattr(src_parent, "category_id", None) else None
-                for c in (await t.fetch_channels()):
-                    if not isinstance(c, (discord.TextChannel, discord.ForumChannel)): continue
-                    if c.name == src_parent.name and c.type == src_parent.type and ((c.category.id if c.category else None) == parent_id or parent_id is None):
-                        tgt_parent = c; break
-                else:
+                tgt_parent = next((c for c in by_name_type.get((_norm(src_parent.name), src_parent.type), ())
+                                   if parent_id is None or c.category_id == parent_id), None)
+                if not tgt_parent:
                     continue
 
             try: src_threads = await self._gather_threads(src_parent)
@@ -922,37 +1078,78 @@ class RevampSync(commands.Cog):
                         await tgt_parent.create_thread(name=th.name, content="Imported by Revamp", reason="Revamp sync: create forum thread")
                     elif isinstance(tgt_parent, discord.TextChannel):
                         await tgt_parent.create_thread(name=th.name, type=discord.ChannelType.public_thread, reason="Revamp sync: create thread")
-                    await asyncio.sleep(self.rate_delay)
                 except Exception as e:
                     p.warnings.append(f"Could not create thread '{th.name}' in {getattr(tgt_parent,'name','?')}: {e}")
 
     # ---------- lockdown ----------
     async def _toggle_lock(self, guild: discord.Guild, enable: bool, plan: Plan):
+        """Lock with a per-channel @everyone deny. Editing the @everyone role wouldn't do: any other role
+        granting send_messages (mirrored roles usually do) would still let its members talk, whereas a
+        channel-level @everyone deny overrides role-level grants."""
         everyone = guild.default_role
-        for ch in [c for c in await guild.fetch_channels() if isinstance(c, discord.TextChannel)]:
+        if not enable:
+            if plan.lock_snapshot:
+                await self._restore_lock_snapshot(guild, plan.lock_snapshot, "Revamp sync: unlock", plan)
+                plan.lock_snapshot = {}
+            return
+
+        # only channels this lock actually changes are recorded, so unlock/rollback touch just those
+        plan.lock_snapshot = {}
+
+        # each channel has its own bucket: run them concurrently under the shared request cap
+        async def lock(ch: discord.TextChannel):
+            current = ch.overwrites_for(everyone)
+            if current.send_messages is False and current.add_reactions is False:
+                return  # already locked here
+            new = copy.copy(current)
+            new.send_messages = False; new.add_reactions = False
+            a, d = current.pair()
             try:
-                current = ch.overwrites_for(everyone)
-                new = copy.copy(current)
-                if enable:
-                    new.send_messages = False; new.add_reactions = False
-                await ch.set_permissions(everyone, overwrite=new, reason="Revamp sync: lockdown" if enable else "Revamp sync: unlock")
-                await asyncio.sleep(self.rate_delay)
+                async with self._sema:
+                    await ch.set_permissions(everyone, overwrite=new, reason="Revamp sync: lockdown")
+                plan.lock_snapshot[ch.id] = (a.value, d.value)
             except discord.Forbidden as e:
                 plan.warnings.append(f"Lockdown change forbidden in #{ch.name}: {e}")
             except Exception as e:
                 plan.warnings.append(f"Lockdown change failed in #{ch.name}: {e}")
 
+        await asyncio.gather(*(lock(ch) for ch in guild.text_channels))
+
+    async def _restore_lock_snapshot(self, guild: discord.Guild, snap: Dict[int, Tuple[int, int]],
+                                     reason: str, plan: Optional[Plan] = None):
+        everyone = guild.default_role
+
+        async def restore(ch: discord.TextChannel, a_val: int, d_val: int):
+            po = discord.PermissionOverwrite.from_pair(discord.Permissions(a_val), discord.Permissions(d_val))
+            try:
+                async with self._sema:
+                    # only the @everyone entry is written; an empty one is removed rather than left at 0/0
+                    await ch.set_permissions(everyone, overwrite=None if po.is_empty() else po, reason=reason)
+            except Exception as e:
+                if plan:
+                    plan.warnings.append(f"Unlock failed in #{ch.name}: {e}")
+
+        jobs = []
+        for cid, (a_val, d_val) in snap.items():
+            ch = guild.get_channel(int(cid))
+            if not ch or not isinstance(ch, discord.TextChannel):
+                continue
+            a, d = ch.overwrites_for(everyone).pair()
+            if (a.value, d.value) != (a_val, d_val):  # skip channels already back to their saved state
+                jobs.append(restore(ch, a_val, d_val))
+        await asyncio.gather(*jobs)
+
     # ---------- role ordering ----------
-    async def _reorder_roles_like_source(self, p: Plan) -> None:
+    async def _reorder_roles_like_source(self, p: Plan, src_roles: List[discord.Role]) -> None:
+        """src_roles: the apply's source snapshot, bottom→top as guild.roles returns it."""
         target, source = p.target, p.source
-        admin = next((r for r in target.roles if not r.managed and _norm(r.name) == _norm(ADMIN_ANCHOR_NAME)), None)
+        admin = next((r for r in target.roles if not r.managed and _norm(r.name) == _ADMIN_ANCHOR_KEY), None)
         if not admin:
             raise RuntimeError(f"{ADMIN_ANCHOR_NAME} anchor not found on target.")
         admin_pos = admin.position
 
-        src_sorted = [r for r in await source.fetch_roles()
+        src_sorted = [r for r in src_roles
                       if not r.managed and r.id != source.default_role.id]
-        src_sorted.sort(key=lambda r: r.position)  # bottom→top
 
         desired: List[discord.Role] = []
         for sr in src_sorted:
@@ -964,19 +1161,21 @@ class RevampSync(commands.Cog):
                 continue
             desired.append(tr)
 
-        pos = 1
-        for role in desired:
-            new_pos = min(admin_pos - 1, max(1, pos))
+        positions: Dict[discord.Role, int] = {}
+        for pos, role in enumerate(desired, start=1):
+            new_pos = min(admin_pos - 1, pos)
             if role.position != new_pos:
-                try:
-                    await role.edit(position=new_pos, reason="Revamp sync: reorder under ADMIN")
-                    await asyncio.sleep(self.rate_delay)
-                except discord.Forbidden:
-                    p.warnings.append(f"Forbidden moving role {role.name}")
-                    self.skipped[p.key] = self.skipped.get(p.key, 0) + 1
-                except discord.HTTPException as e:
-                    p.warnings.append(f"Failed moving role {role.name}: {e}")
-            pos += 1
+                positions[role] = new_pos
+        if not positions:
+            return
+        # one bulk PATCH for every moved role instead of a request per role
+        try:
+            await target.edit_role_positions(positions=positions, reason="Revamp sync: reorder under ADMIN")
+        except discord.Forbidden:
+            p.warnings.append(f"Forbidden moving {len(positions)} role(s) under {ADMIN_ANCHOR_NAME}")
+            self.skipped[p.key] = self.skipped.get(p.key, 0) + len(positions)
+        except discord.HTTPException as e:
+            p.warnings.append(f"Failed moving {len(positions)} role(s): {e}")
 
 # ---------- UI view & components ----------
 class ControlView(ui.View):
@@ -1011,17 +1210,23 @@ class ControlView(ui.View):
         full.mirror_overwrites = True
         full.control_msg = plan.control_msg
         self.cog.pending[self.plan_key] = full
+        # fresh window for the confirm step
+        self.cog._arm_expiry(self.plan_key)
 
         confirm = ConfirmApplyView(self.cog, self.plan_key)
         try:
             await plan.control_msg.edit(embed=self.cog._panel_embed(full, step="Review Plan"), view=confirm)
         except Exception:
             pass
+        else:
+            # the confirm view replaced this one on the panel; stop it now rather than leaving it
+            # registered (with its 15-minute timeout) until it expires
+            self.stop()
         await _ireply(inter, "Plan prepared. Review and confirm.", ephemeral=True)
 
     @ui.button(label="Cancel", style=discord.ButtonStyle.secondary, row=3)
     async def cancel(self, inter: discord.Interaction, btn: ui.Button):
-        plan = self.cog.pending.pop(self.plan_key, None)
+        plan = self.cog._drop_plan(self.plan_key)
         await _ireply(inter, "Cancelled. No changes made.", ephemeral=True)
         if plan and plan.control_msg:
             try:
@@ -1070,7 +1275,7 @@ class TargetSelect(ui.Select):
         plan = self.cog.pending.get(self.plan_key)
         if not plan: return await _ireply(inter, "Expired.", ephemeral=True)
         gid = int(self.values[0])
-        tgt = next((g for g in self.cog.bot.guilds if g.id == gid), None)
+        tgt = self.cog.bot.get_guild(gid)
         if not tgt:
             return await _ireply(inter, "Target not found.", ephemeral=True)
         plan.target = tgt
@@ -1140,6 +1345,8 @@ class ConfirmApplyView(ui.View):
         except Exception:
             pass
 
+        # an apply can outlast the expiry window; don't let the timer drop the plan mid-run
+        self.cog._disarm_expiry(self.plan_key)
         try:
             if not inter.response.is_done():
                 await inter.response.defer(thinking=True)
@@ -1147,7 +1354,7 @@ class ConfirmApplyView(ui.View):
             pass
         try:
             result = await self.cog.apply_plan(plan)
-            self.cog.pending.pop(self.plan_key, None)
+            self.cog._drop_plan(self.plan_key)
             try:
                 if plan.control_msg: await plan.control_msg.edit(embed=result, view=None)
             except Exception:
@@ -1155,6 +1362,7 @@ class ConfirmApplyView(ui.View):
             await _ireply(inter, embed=result)
             self.stop()
         except Exception as e:
+            self.cog._drop_plan(self.plan_key)
             await _ireply(inter, f"❌ Apply failed: {e}")
             self.stop()
 
@@ -1172,7 +1380,7 @@ class ConfirmApplyView(ui.View):
 
     @ui.button(label="Cancel", style=discord.ButtonStyle.secondary, row=3)
     async def cancel(self, inter: discord.Interaction, btn: ui.Button):
-        plan = self.cog.pending.pop(self.plan_key, None)
+        plan = self.cog._drop_plan(self.plan_key)
         await _ireply(inter, "Cancelled. No changes made.", ephemeral=True)
         if plan and plan.control_msg:
             try: